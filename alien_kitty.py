@@ -1,102 +1,273 @@
+import argparse
+import atexit
+import os
+import random
 import sys
+import threading
+import time
 import pygame
-import random
-import math
 from settings import Settings
 from kitty import Kitty
 from bullet import Bullet
+from projectiles import Projectile
 from octo import Octo
+from formation import Formation
+from animation import Animation
+from background import Background
+from assets import AssetManager
+from renderer import DirtyRectRenderer
+from hud import Hud
+from pacing import FramePacer
+from scenes import GameOverScene, LoadingScene, PausedScene
+from profiler import FrameProfiler
+from replay import ReplayRecorder
+import snapshot
+from pool import ObjectPool
+from spatial_hash import SpatialHash, collide_mask, hashed_groupcollide, hashed_spritecollide
 
 class AlienKitty:
     """Overall class to manage game assets and behavior"""
 
-    def __init__(self):
-        """Initialize the game, and create game resources"""
-        pygame.init()
+    def __init__(self, headless=False, overrides=None):
+        """Initialize the game, and create game resources
+
+        With headless=True the SDL dummy video and audio drivers are used, nothing
+        is drawn or played, and the game is advanced with step() instead of run_game().
+        overrides is an optional {setting name: value} dict applied to Settings
+        before anything else is built.
+        """
+        self.startup_timings = {}  # Phase -> milliseconds, see _mark_startup()
+        self._startup_time = self._startup_start = time.perf_counter()
+
+        if headless:
+            # Must be set before pygame initialises the display and mixer
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
 
         self.settings = Settings()
-        
-        self.screen = pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height))
+        for name, value in (overrides or {}).items():
+            setattr(self.settings, name, value)
+        self.settings.headless = headless
+        self.settings.apply_render_scale()
+        if headless:
+            self.settings.sound_enabled = False
+        self._init_pygame()
+        self._mark_startup('init')
+
+        # The dummy driver still gives a real surface, so convert_alpha() keeps working
+        self.screen = self._create_display()
         pygame.display.set_caption("Alien Kitty")
+        self._mark_startup('display')
+
         self.game_over = self.settings.game_over
+        self.game_over_reason = None
+        self.frames = 0
+        self.tick = 0  # Simulation steps since startup; unlike frames, not reset on restart
         self.clock = pygame.time.Clock()
 
+        # All gameplay randomness comes from this generator, so a seed reproduces a session
+        self.seed = self.settings.seed
+        if self.seed is None:
+            self.seed = random.SystemRandom().getrandbits(63)
+        self.rng = random.Random(self.seed)
+
+        # Fixed simulation timestep; sim_time drives all game timers
+        self.dt = 1 / self.settings.sim_hz
+        self.sim_time = 0.0
+        self.render_alpha = 1.0
+
+        self.assets = AssetManager(self)
+        self.loading_scene = LoadingScene(self)
+        self._preload_assets()
+        self._mark_startup('assets')
+
         self._call_sprite_groups()
+        self.background = Background(self)
+        self.renderer = DirtyRectRenderer(self)
+        self.hud = Hud(self)
+        self.flash_effects = True  # Switched off by the lowest quality tier
+        self.pacer = FramePacer(self)
+        self.game_over_scene = GameOverScene(self)
+        self.paused_scene = PausedScene(self)
+        self.paused = False
         self.kitty = Kitty(self)
+        self._create_pools()
         self._initialize_octo()
-        
-        self._play_background_music()
+        self.initial_snapshot = self.snapshot()  # Restarting restores this instead of rebuilding the level
+
+        self.recorder = None
+        if self.settings.replay_record_path:
+            self.recorder = ReplayRecorder(self, self.settings.replay_record_path)
+
+        # Gameplay recording; NumPy is only needed when it is switched on
+        self.frame_writer = None
+        if self.settings.capture_record_path:
+            self._start_frame_writer(self.settings.capture_record_path)
+
+        self.profiler = FrameProfiler(self)
+        if self.settings.profiler_enabled:
+            self.profiler.enable()
+
+        self._mark_startup('world')
+
+        if self.settings.sound_enabled:
+            # Nothing waits for the music, so it is opened off the main thread
+            threading.Thread(target=self._play_background_music, daemon=True).start()
+
+        self.startup_timings['total'] = (time.perf_counter() - self._startup_start) * 1000
+        if self.settings.startup_report:
+            print('Startup: ' + ', '.join(f"{phase} {ms:.1f} ms" for phase, ms in self.startup_timings.items()))
+
+    def _create_display(self):
+        """Open the window and return the surface the game draws on
+
+        Below render_scale 1 the game draws at the lower internal resolution.
+        SDL stretches it to the window ('scaled'), or _present() scales it onto
+        a full-size window in software ('blit'). SCALED only enlarges by whole
+        factors, so a scale like 0.75 is always blitted. vsync needs the SCALED
+        flag and falls back to clock pacing if refused or blitting.
+        """
+        size = (self.settings.screen_width, self.settings.screen_height)
+        self.window = None  # Only set when scaling in software
+        if self.settings.headless:
+            return pygame.display.set_mode(size)
+        scale = self.settings.render_scale
+        whole_factor = abs(1 / scale - round(1 / scale)) < 1e-6
+        if scale != 1 and (self.settings.render_scale_mode == 'blit' or not whole_factor):
+            self.window = pygame.display.set_mode((round(size[0] / scale), round(size[1] / scale)))
+            if self.settings.pacing_mode == 'vsync':
+                print("Vsync isn't available when scaling in software; pacing with the clock instead")
+                self.settings.pacing_mode = 'sleep'
+            return pygame.Surface(size).convert()
+        flags = pygame.SCALED if scale != 1 else 0
+        if self.settings.pacing_mode == 'vsync':
+            try:
+                return pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)
+            except pygame.error:
+                print("Vsync isn't available; pacing with the clock instead")
+                self.settings.pacing_mode = 'sleep'
+        return pygame.display.set_mode(size, flags)
+
+    def _init_pygame(self):
+        """Initialise only the pygame modules the game uses"""
+        pygame.display.init()
+        pygame.font.init()
+        if self.settings.sound_enabled:
+            try:
+                pygame.mixer.init()
+            except pygame.error as error:
+                print(f"Sound disabled: {error}")
+                self.settings.sound_enabled = False
+
+    def _mark_startup(self, phase):
+        """Record how long the startup phase that just finished took"""
+        now = time.perf_counter()
+        self.startup_timings[phase] = (now - self._startup_time) * 1000
+        self._startup_time = now
+
+    def _preload_assets(self):
+        """Load what the first frame needs behind a loading screen; blast frames follow in the background"""
+        specs = [
+            ('images/AlienKitty.png', self.settings.kitty_size, 'alpha'),
+            ('images/AlienOctoBig.png', self.settings.boss_alien_size, 'alpha'),
+            ('images/AlienOctoSmall.png', self.settings.small_alien_size, 'alpha'),
+        ]
+        if self.settings.headless:
+            specs += self._blast_specs()  # No window to keep responsive, and rendered frames mustn't depend on load timing
+        sounds = []
+        if self.settings.sound_enabled:
+            sounds = [self.settings.bullet_sound_path, self.settings.blast_sound_path, self.settings.kitty_sound_path]
+        progress = None if self.settings.headless else self._show_loading_progress
+        self.assets.preload(specs, sounds, progress)
+        for path, size in (('images/AlienOctoBig.png', self.settings.boss_alien_size),
+                           ('images/AlienOctoSmall.png', self.settings.small_alien_size)):
+            self.assets.tinted(path, size, self.settings.hit_flash_color)  # Hit-flash frames
+        if self.settings.minion_rotation_steps:
+            self.assets.rotations('images/AlienOctoSmall.png', self.settings.small_alien_size,
+                                  self.settings.minion_rotation_steps, self.settings.hit_flash_color)
+        self.assets.circle(self.settings.projectile_size, self.settings.projectile_color)
+
+    def _start_frame_writer(self, path):
+        """Stream every rendered frame to a raw file, or through ffmpeg for other extensions"""
+        from capture import FrameCapture, FrameWriter, ffmpeg_command
+        if path.endswith('.raw'):
+            self.frame_writer = FrameWriter(self, path=path)
+        else:
+            command = ffmpeg_command(FrameCapture(self, ring_size=1), self.settings.render_fps, path)
+            self.frame_writer = FrameWriter(self, command=command)
+        atexit.register(self.frame_writer.close)
+
+    def _show_loading_progress(self, done, total):
+        """Keep the loading screen drawn and the window responsive while assets load"""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                sys.exit()
+        self.loading_scene.progress = done / total if total else 1.0
+        self.loading_scene.draw()
+
+    def _create_pools(self):
+        """Create the pools that recycle bullets and projectiles"""
+        self.bullet_pool = ObjectPool(lambda: Bullet(self), self.settings.bullet_pool_capacity)
+        self.projectile_pool = ObjectPool(lambda: Projectile(self), self.settings.projectile_pool_capacity)
+        self.bullet_pool.prefill(self.settings.bullets_allowed)
+        self.projectile_pool.prefill(self.settings.projectile_pool_prefill)
 
     def _call_sprite_groups(self):
         self.bullets = pygame.sprite.Group()
         self.octo = pygame.sprite.Group()
+        self.bosses = pygame.sprite.Group()   # Bosses and minions are also in octo; these skip filtering by type
+        self.minions = pygame.sprite.Group()
+        self.formations = {}  # boss -> Formation of its minions
+        self.fallen_octos = []  # Killed octos, kept for snapshot.restore() to reuse
         self.projectiles = pygame.sprite.Group()
+        self.animations = pygame.sprite.Group()
 
-    def _draw_gradient(self):
-        """Draw a vertical gradient from start_color to end_color using the instance settings"""
-        height = self.settings.screen_height
-        width = self.settings.screen_width
-        start_color = self.settings.gradient_start_color
-        end_color = self.settings.gradient_end_color
-
-        for i in range(height):
-            ratio = i / height
-            intermediate_color = (
-                int(start_color[0] * (1 - ratio) + end_color[0] * ratio),
-                int(start_color[1] * (1 - ratio) + end_color[1] * ratio),
-                int(start_color[2] * (1 - ratio) + end_color[2] * ratio)
-            )
-            pygame.draw.line(self.screen, intermediate_color, (0, i), (width, i))
-
-        # Simulate stars
-        for _ in range(20):  # Adjust number for more/less stars
-            star_x = random.randint(0, width)
-            star_y = random.randint(0, height)
-            pygame.draw.circle(self.screen, (255, 255, 255), (star_x, star_y), 1)  # Small white dots
-
-    def _draw_borders(self):
-        """Draw both outer and inner borders."""
-        # Draw the outer border
-        pygame.draw.rect(
-            self.screen, 
-            self.settings.outer_border_color, 
-            (self.settings.outer_border_thickness // 2, 
-            self.settings.outer_border_thickness // 2, 
-            self.settings.screen_width - self.settings.outer_border_thickness, 
-            self.settings.screen_height - self.settings.outer_border_thickness), 
-            self.settings.outer_border_thickness
-        )
-
-        # Draw the inner border (inset from the outer border)
-        pygame.draw.rect(
-            self.screen, 
-            self.settings.inner_border_color, 
-            (self.settings.outer_border_thickness + self.settings.inner_border_thickness // 2, 
-            self.settings.outer_border_thickness + self.settings.inner_border_thickness // 2, 
-            self.settings.screen_width - 2 * self.settings.outer_border_thickness - self.settings.inner_border_thickness, 
-            self.settings.screen_height - 2 * self.settings.outer_border_thickness - self.settings.inner_border_thickness), 
-            self.settings.inner_border_thickness
-        )
+        # Broadphase grids; octos are rebuilt every check, while projectiles are
+        # bucketed by column once on spawn since they only ever move vertically
+        self.octo_grid = SpatialHash(self.settings.spatial_hash_cell_size)
+        self.projectile_grid = SpatialHash(self.settings.spatial_hash_cell_size, columns_only=True)
+
+        # Optional vectorized projectile engine; NumPy is only needed when it is selected
+        self.projectile_array = None
+        if self.settings.projectile_engine == 'numpy':
+            from projectile_array import ProjectileArray
+            self.projectile_array = ProjectileArray(self)
 
     def _play_background_music(self):
         """Plays background music indefinitely"""
-        pygame.mixer.music.load('sounds/Space.mp3')
+        pygame.mixer.music.load(self.settings.music_path)
         pygame.mixer.music.set_volume(2.0)  # Adjust volume if needed
         pygame.mixer.music.play(-1)  # Loop indefinitely
     
     def _check_events(self):
         """Respond to key presses and mouse events"""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT :
-                pygame.mixer.music.stop()
-                sys.exit()
+            self._handle_event(event)
+
+    def _wait_for_events(self):
+        """Sleep until an event arrives (or the timeout passes), then handle the queue"""
+        event = pygame.event.wait(self.settings.scene_event_timeout)
+        if event.type != pygame.NOEVENT:
+            self._handle_event(event)
+        self._check_events()
+
+    def _handle_event(self, event):
+        """Respond to a single event"""
+        if event.type == pygame.QUIT :
+            self._quit()
+
+        if self.recorder is not None:
+            self.recorder.record(event)  # Ignores anything that doesn't affect gameplay
 
-            elif event.type == pygame.KEYDOWN:
-                self._check_keydown_events(event)
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP) and not (self.game_over or self.paused):
+            self.pacer.input_received()  # Keys on the pause and game over screens aren't gameplay input
+
+        if event.type == pygame.KEYDOWN:
+            self._check_keydown_events(event)
+
+        elif event.type == pygame.KEYUP:
+              self._check_keyup_events(event)
 
-            elif event.type == pygame.KEYUP:
-                  self._check_keyup_events(event)
-                
     def _check_keydown_events(self, event):
         """Respond to keypresses"""
         if event.key == pygame.K_RIGHT:
@@ -106,13 +277,23 @@ class AlienKitty:
             # Move kitty to the left
             self.kitty.moving_left = True
         elif event.key in (pygame.K_ESCAPE, pygame.K_q):
-            pygame.mixer.music.stop()
-            sys.exit()
+            self._quit()
         elif event.key == pygame.K_r and self.game_over:
             self._restart_game()
-        elif event.key == pygame.K_SPACE:
+        elif event.key == pygame.K_F3:
+            self.profiler.toggle_hud()
+        elif event.key == pygame.K_p and not self.game_over:
+            self._toggle_pause()
+        elif event.key == pygame.K_SPACE and not self.paused:
             self._fire_bullet()
-            self.settings.bullet_sound.play()
+            if self.settings.sound_enabled:
+                self.assets.sound(self.settings.bullet_sound_path).play()
+
+    def _quit(self):
+        """Stop the music and exit"""
+        if self.settings.sound_enabled:
+            pygame.mixer.music.stop()
+        sys.exit()
 
     def _check_keyup_events(self, event):
         """Respond to keyreleases"""
@@ -121,52 +302,68 @@ class AlienKitty:
         elif event.key == pygame.K_LEFT:
             self.kitty.moving_left = False
 
-    def load_blast_images(self):
-        """Loads and resizes blast images for the animation"""
-        self.blast_images = []
-        for i in range(1, 4):  # Assuming you have 5 images for the blast sequence
-            image = pygame.image.load(f'images/blast{i}.png').convert_alpha()
-            image = pygame.transform.scale(image, self.settings.boss_alien_size)  # Resize image
-            self.blast_images.append(image)
+    def _blast_specs(self):
+        """(path, size, mode) of every blast frame, at boss and minion size"""
+        return [(f'images/blast{i}.png', size, 'alpha')
+                for size in (self.settings.boss_alien_size, self.settings.small_alien_size) for i in range(1, 4)]
 
     def _fire_bullet(self):
         """Create a new bullet and add it to the bullet group"""
         if len(self.bullets) < self.settings.bullets_allowed:
-            new_bullet = Bullet(self)
+            new_bullet = self.bullet_pool.acquire()  # Recycled when possible
+            new_bullet.reset()
             self.bullets.add(new_bullet)
     
     def _update_bullets(self):
         """Update position of the bullet and check for collisions"""
         # Update bullet position
-        self.bullets.update()
+        self.bullets.update(self.dt)
         self._check_bullet_octo_collisions()
 
     def _update_projectiles(self):
         """Update position of the projectiles and check for collisions"""
         # Update projectile position
-        self.projectiles.update()
+        if self.projectile_array is not None:
+            self.projectile_array.update(self.dt)
+        else:
+            self.projectiles.update(self.dt)
         self._check_projectile_kitty_collisions()
 
     def _check_bullet_octo_collisions(self):
         """Check for any bullets that have hit octos"""
-        collisions = pygame.sprite.groupcollide(self.bullets, self.octo, True, False)
+        collided = collide_mask if self.settings.collision_mode == 'mask' else None
+        if self.settings.collision_broadphase:
+            collisions = hashed_groupcollide(self.octo_grid, self.bullets, self.octo, True, collided)
+        else:
+            collisions = pygame.sprite.groupcollide(self.bullets, self.octo, True, False, collided)
         for octos in collisions.values():
             for octo in octos:
+                if not octo.alive():
+                    continue  # Already destroyed by another bullet this step
                 octo.hit()  # Call hit method, which handles health and flash
                 if octo.health <= 0:
+                    octo.kill()
                     if octo.octo_type == 'boss':
-                        octo.kill()
                         octo.hit_sound()
-                        self._start_blast_animation(self.boss_octo.rect.center)
-                    else:    
-                        octo.kill()
+                        # The game ends once the explosion has finished playing
+                        self._start_blast_animation(octo.rect.center, self.settings.boss_alien_size,
+                                                    on_complete=self._on_boss_blast_complete)
+                    else:
+                        self._start_blast_animation(octo.rect.center, self.settings.small_alien_size)
 
     def _check_projectile_kitty_collisions(self):
         """Check for collisions between projectiles and Kitty"""
         # This checks for collisions and can optionally make the projectiles disappear on hit
-        collisions = pygame.sprite.spritecollide(self.kitty, self.projectiles, True)
-        if collisions:
-            for projectile in collisions:
+        pixel_perfect = self.settings.collision_mode == 'mask'
+        collided = collide_mask if pixel_perfect else None
+        if self.projectile_array is not None:
+            hits = self.projectile_array.collide(self.kitty.rect, self.kitty.mask if pixel_perfect else None)
+        elif self.settings.collision_broadphase:
+            hits = len(hashed_spritecollide(self.projectile_grid, self.kitty, True, collided))
+        else:
+            hits = len(pygame.sprite.spritecollide(self.kitty, self.projectiles, True, collided))
+        if hits:
+            for _ in range(hits):
                 # Assuming Kitty has a health attribute
                 self.kitty.health -= 1
                 self.kitty.hit_sound()
@@ -174,36 +371,53 @@ class AlienKitty:
                     self.game_over = True
                     self._handle_kitty_death()
 
-    def _start_blast_animation(self, position):
-        """Handle blast animation when boss octo dies"""
-        self.load_blast_images()
-        self.blast_animation_active = True
-        self.blast_animation_position = position
-        self.blast_animation_frame = 0
-
-        while self.blast_animation_active and self.blast_animation_frame < len(self.blast_images):
-            frame = self.blast_images[self.blast_animation_frame]
-            frame_rect = frame.get_rect(center=self.blast_animation_position)
-            self.screen.blit(frame, frame_rect)
-            self.blast_animation_frame += 1
-            pygame.display.flip()  # Update the display to reflect the new frame
-
-            if self.blast_animation_frame >= len(self.blast_images):
-                self.blast_animation_active = False  # Stop the animation
-            pygame.time.wait(200)  # Wait a bit between frames to make the animation visible
-
-        self.game_over = True
-        self._handle_octo_death()
+    def _start_blast_animation(self, position, size, on_complete=None):
+        """Play a blast animation at position without blocking the game loop"""
+        frames = [self.assets.image_if_ready(f'images/blast{i}.png', size) for i in range(1, 4)]
+        if None in frames:
+            # Still decoding; an invisible blast keeps the timing, and so the game, the same
+            frames = [self.assets.blank(size)] * 3
+        blast = Animation(frames, position, self.settings.blast_frame_time, on_complete=on_complete)
+        self.animations.add(blast)
+
+    def _on_boss_blast_complete(self):
+        """End the game once the last boss's explosion has played, unless the kitty died first"""
+        if not self.game_over and not self.bosses:
+            self.game_over = True
+            self._handle_octo_death()
 
     def _initialize_octo(self):
-        self.boss_octo = self._create_boss_octo(self.settings.screen_width / 2, self.settings.screen_height / 2 - 100)  # Centralized boss
-        self._create_octo_circle(self.boss_octo, 5)  # Minions in a circle around the boss
+        """Create the level's bosses, spread across the screen, each with its minion formation"""
+        count = self.settings.boss_count
+        bosses = [
+            self._create_boss_octo(self.settings.screen_width * (i + 1) / (count + 1), self.settings.screen_height / 2 - 100 * self.settings.render_scale)
+            for i in range(count)
+        ]
+        self.boss_octo = bosses[0]
+        for boss in bosses:
+            for shape, *args in self.settings.minion_formation:
+                add = getattr(self._formation(boss), f'add_{shape}', None)
+                if add is None:
+                    raise ValueError(f"unknown minion formation shape {shape!r}")
+                add(*args)
 
     def _create_boss_octo(self, x, y):
         """Boss octo creation"""
         boss_octo = Octo(self, 'images/AlienOctoBig.png', x, y, octo_type='boss')
         self.octo.add(boss_octo)
+        self.bosses.add(boss_octo)
         return boss_octo
+
+    def _formation(self, boss):
+        """The formation orbiting boss, created on first use"""
+        formation = self.formations.get(boss)
+        if formation is None:
+            formation_class = Formation
+            if self.settings.formation_engine == 'numpy':
+                from formation import ArrayFormation
+                formation_class = ArrayFormation
+            formation = self.formations[boss] = formation_class(self, boss)
+        return formation
     
     def _calculate_fixed_radius(self, boss_center_x, boss_center_y, minion_width, minion_height):
         """Calculate minion radius"""
@@ -218,139 +432,221 @@ class AlienKitty:
 
     def _create_octo_circle(self, boss_octo, count):
         """Create minion circle"""
-        cx, cy = boss_octo.rect.center
-        minion_width = minion_height = self.settings.small_alien_size[0]
-        radius = self._calculate_fixed_radius(cx, cy, minion_width, minion_height)
-
-        angle_step = 360 / count if count > 0 else 0
-        for i in range(count):
-            angle = i * angle_step
-            rad_angle = math.radians(angle)
-            x = cx + radius * math.cos(rad_angle)
-            y = cy + radius * math.sin(rad_angle)
-
-            new_octo = Octo(self, 'images/AlienOctoSmall.png', x, y, octo_type='small')
-            new_octo.angle = angle
-            self.octo.add(new_octo)
+        self._formation(boss_octo).add_ring(count)
 
     def _update_minions(self):
-        """Update minions wrt the boss octo"""
-        boss_octo = next((o for o in self.octo if o.octo_type == 'boss'), None)
-        if boss_octo:
-            cx, cy = boss_octo.rect.center
-            minion_width = minion_height = self.settings.small_alien_size[0]
-            radius = self._calculate_fixed_radius(cx, cy, minion_width, minion_height)
-
-            for octo in (o for o in self.octo if o.octo_type == 'small'):
-                octo.angle = (octo.angle + 0.5) % 360
-                rad_angle = math.radians(octo.angle)
-                octo.rect.x = cx + radius * math.cos(rad_angle) - octo.rect.width / 2
-                octo.rect.y = cy + radius * math.sin(rad_angle) - octo.rect.height / 2
+        """Update minions wrt their boss octo"""
+        for formation in self.formations.values():
+            formation.update(self.dt)
 
         for octo in self.octo:
-            octo.update()  # Update all Octos, including the boss which now handles its own movement logic
-
-    def _display_game_over(self, reason):
-        """Game over screen when kitty or octo dies"""
-        self.game_over_reason = reason
-        # Fill the screen with a dark overlay or another appropriate game over background
-        self.screen.fill((0, 0, 0))  # Using black for simplicity
-
-        # Set the main game over font size dynamically based on screen height
-        self.game_over_font_size = max(40, int(self.settings.screen_height / 10))
-        self.instructions_font_size = max(20, int(self.settings.screen_height / 20))  # Smaller font size for instructions
-
-        # Initialize fonts
-        self.game_over_font = pygame.font.Font(None, self.game_over_font_size)
-        self.instructions_font = pygame.font.Font(None, self.instructions_font_size)
-
-        if self.game_over_reason == 'kitty':
-            # Display game over text in the center of the screen
-            game_over_text = self.game_over_font.render('GAME OVER!', True, (255, 0, 0))  # Red color
-
-        elif self.game_over_reason == 'octo':
-            # Display game over text in the center of the screen
-            game_over_text = self.game_over_font.render('OCTO HAS BEEN DEFEATED!', True, (255, 0, 0))  # Red color
-
-        # Additional instructions
-        restart_text = self.instructions_font.render('Press "R" to Restart', True, (255, 255, 255))  # White color for visibility
-        quit_text = self.instructions_font.render('Press "Q" to Quit', True, (255, 255, 255))  # White color
+            octo.update(self.dt)  # Update all Octos, including the boss which now handles its own movement logic
 
-        game_over_rect = game_over_text.get_rect(center=(self.settings.screen_width / 2, self.settings.screen_height / 2 - self.game_over_font_size))
-        restart_rect = restart_text.get_rect(center=(self.settings.screen_width / 2, self.settings.screen_height / 2))
-        quit_rect = quit_text.get_rect(center=(self.settings.screen_width / 2, self.settings.screen_height / 2 + self.instructions_font_size))
-
-        # Blit the texts onto the screen
-        self.screen.blit(game_over_text, game_over_rect)
-        self.screen.blit(restart_text, restart_rect)
-        self.screen.blit(quit_text, quit_rect)
-
-        pygame.display.flip()
-
-        self._check_events()
+    def _toggle_pause(self):
+        """Pause or resume the game"""
+        self.paused = not self.paused
+        if self.paused:
+            self.paused_scene.enter()
+        else:
+            self.renderer.invalidate()  # The pause screen covered the whole display
 
     def _restart_game(self):
         """Reset the game"""
         # Reset game states
-        self.game_over = False
-        # Reset all necessary attributes and game entities
-        self.kitty.reset_health()
-        self.octo.empty()
-        self.bullets.empty()
-        self.projectiles.empty()
-        # Reinitialize the game state or reload the level
-        self.boss_octo = self._create_boss_octo(self.settings.screen_width / 2, self.settings.screen_height / 2 - 100)
-        self._create_octo_circle(self.boss_octo, 5)
+        self.paused = False
+        self.renderer.invalidate()  # The game over screen covered the whole display
+        self.game_over_scene.invalidate()  # Or the next game over with the same reason would show nothing
+        # Back to the level as first built, reusing the octos rather than making new ones
+        snapshot.restore(self, self.initial_snapshot, restart=True)
+
+    def snapshot(self):
+        """Capture the game state as plain data; see snapshot.py"""
+        return snapshot.capture(self)
+
+    def restore(self, state):
+        """Return to a state captured by snapshot()"""
+        snapshot.restore(self, state)
+        self.renderer.invalidate()
 
     def _handle_octo_death(self):
         """Handle octo death"""
-        self._display_game_over('octo')
+        self.game_over_reason = 'octo'
 
     def _handle_kitty_death(self):
         """Handle kitty death"""
-        self._display_game_over('kitty')
+        self.game_over_reason = 'kitty'
 
     def _update_game(self):
         """Handle all update methods"""
-        self.kitty.update()
+        self.frames += 1
+        self.tick += 1
+        self.sim_time += self.dt
+        self.kitty.update(self.dt)
         self._update_bullets()
         self._update_minions()
         self._update_projectiles()
+        self.animations.update(self.dt)
 
     def _draw_game_elements(self):
-        """Draw all the game elements"""
-        self.kitty.blitme()
-        self.kitty.draw_health_bar()
+        """Draw all the game elements and return the rects that were drawn"""
+        drawn = [self.kitty.blitme()]
         for bullet in self.bullets:
-            bullet.draw_bullet()
+            drawn.append(bullet.draw_bullet())
         for octo in self.octo:
-            octo.draw()
+            drawn.append(octo.draw())
+        drawn.extend(self.hud.draw())
+        if self.projectile_array is not None:
+            drawn.extend(self.projectile_array.draw(self.render_alpha))
         for projectile in self.projectiles:
-            projectile.draw_projectile()
-
-    def _render_objects(self):
-        """Render everything on the screen"""
-        # Draw the gradient background first
-        self._draw_gradient()
-        # Draw the inner and outer borders
-        self._draw_borders()
-        self._draw_game_elements()
-        pygame.display.flip()
+            drawn.append(projectile.draw_projectile())
+        for animation in self.animations:
+            drawn.append(animation.draw(self.screen))
+        if self.profiler.hud_visible:
+            drawn.append(self.profiler.draw_hud(self.screen))
+        return drawn
+
+    def _all_sprites(self):
+        """Every object that moves and gets drawn"""
+        return [self.kitty, *self.bullets, *self.octo, *self.projectiles]
+
+    def _store_previous_positions(self):
+        """Remember where everything was before a simulation step, for interpolation"""
+        for sprite in self._all_sprites():
+            sprite.previous_topleft = sprite.rect.topleft
+        if self.projectile_array is not None:
+            self.projectile_array.store_previous_positions()
+
+    def _render_objects(self, alpha=1.0):
+        """Render everything on the screen
+
+        alpha is how far the real time is between the previous and the current
+        simulation step; sprites are drawn at the interpolated position.
+        """
+        self.render_alpha = alpha
+        current = {}
+        if alpha < 1.0:
+            for sprite in self._all_sprites():
+                # Sprites spawned during the last step have no previous position yet
+                px, py = getattr(sprite, 'previous_topleft', sprite.rect.topleft)
+                current[sprite] = sprite.rect.topleft
+                sprite.rect.topleft = (
+                    round(px + (sprite.rect.x - px) * alpha),
+                    round(py + (sprite.rect.y - py) * alpha),
+                )
+
+        if self.settings.dirty_rect_rendering:
+            # Only push the regions that changed since the last frame
+            self.renderer.render()
+        else:
+            # Draw the pre-rendered gradient, stars and borders in a single blit
+            self.background.draw()
+            self._draw_game_elements()
+            self._present()
+
+        # Put the simulated positions back
+        for sprite, topleft in current.items():
+            sprite.rect.topleft = topleft
+
+    def _present(self, rects=None):
+        """Push the finished frame to the display, or only the given rects"""
+        if self.window is not None:
+            # The software scale rewrites the whole window, so there is nothing to gain from rects
+            pygame.transform.scale(self.screen, self.window.get_size(), self.window)
+            rects = None
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    def step(self, n=1):
+        """Advance the simulation n frames without rendering and return the game state
+
+        Drive the kitty by setting kitty.moving_left / kitty.moving_right and
+        calling _fire_bullet() between steps. Stepping stops early on game over.
+        """
+        for _ in range(n):
+            if self.game_over:
+                break
+            self._store_previous_positions()
+            self._update_game()
+            if self.profiler.enabled:
+                self.profiler.end_frame()
+        return self.get_state()
+
+    def get_state(self):
+        """Return a plain-data summary of the current game state"""
+        minions = self.minions.sprites()
+        return {
+            'frame': self.frames,
+            'game_over': self.game_over,
+            'game_over_reason': self.game_over_reason,
+            'kitty_x': self.kitty.x,
+            'kitty_health': self.kitty.health,
+            'boss_health': self.boss_octo.health if self.boss_octo.alive() else 0,
+            'minions': len(minions),
+            'minion_health': [o.health for o in minions],
+            'bullets': len(self.bullets),
+            'projectiles': len(self.projectiles) + len(self.projectile_array or ()),
+        }
 
     def run_game(self):
         """Start the main loop for the game"""
+        if self.settings.headless:
+            # No window and no frame cap; run as fast as the CPU allows until the game ends
+            while not self.game_over:
+                self.step()
+            return self.get_state()
+
+        previous_time = time.perf_counter()
+        accumulator = 0.0
         while True:
+            if self.game_over or self.paused:
+                # Static scenes are drawn once and then we sleep until there is input
+                scene = self.game_over_scene if self.game_over else self.paused_scene
+                scene.draw()
+                self._wait_for_events()
+                previous_time = time.perf_counter()  # Don't catch up on time spent in the menu
+                accumulator = 0.0
+                self.pacer.resync()
+                continue
+
             # Watch for keyboard and mouse events
+            self.pacer.begin_frame()
             self._check_events()
-            if not self.game_over:
+
+            now = time.perf_counter()
+            # Cap the catch-up so a long stall doesn't snowball into more stalls
+            accumulator += min(now - previous_time, self.settings.max_frame_time)
+            previous_time = now
+
+            # Run as many fixed steps as real time demands, then render once
+            while accumulator >= self.dt and not (self.game_over or self.paused):
+                self._store_previous_positions()
                 self._update_game()
-                self._render_objects()
-            else:
-                self._display_game_over(self.game_over_reason)
-                continue
-            self.clock.tick(60)
+                accumulator -= self.dt
+            self.pacer.end_update()
+
+            # Under load the simulation keeps real time and frames are dropped instead
+            if not (self.game_over or self.paused) and self.pacer.should_render():
+                self._render_objects(accumulator / self.dt)
+                self.pacer.end_render()
+                if self.pacer.presented_frames == 1:
+                    self.assets.load_in_background(self._blast_specs())  # The game is on screen; decode the blasts off the main thread
+                if self.frame_writer is not None:
+                    self.frame_writer.write()
+            if self.profiler.enabled:
+                self.profiler.end_frame()
+            self.pacer.end_frame(self.clock)
 
 if __name__ == '__main__':
     # Make a game instance, and run the game
-    ak = AlienKitty()
+    parser = argparse.ArgumentParser(description='Alien Kitty')
+    parser.add_argument('--record', metavar='FILE', help='record the session to a replay file')
+    parser.add_argument('--seed', type=int, help='seed for all gameplay randomness')
+    parser.add_argument('--capture', metavar='FILE', help='record video to FILE (.raw frames, or any format ffmpeg writes)')
+    parser.add_argument('--startup-report', action='store_true', help='print how long each startup phase took')
+    args = parser.parse_args()
+
+    ak = AlienKitty(overrides={'replay_record_path': args.record, 'seed': args.seed,
+                               'capture_record_path': args.capture, 'startup_report': args.startup_report})
     ak.run_game()
\ No newline at end of file
@@ -0,0 +1,45 @@
+from pygame.sprite import Sprite
+
+class Animation(Sprite):
+    """A sprite that steps through a list of frames on simulation time
+
+    Animations are updated by the main loop like any other sprite, so any
+    number can play at once without blocking input or the frame clock.
+    """
+
+    def __init__(self, frames, center, frame_time, loop=False, on_complete=None):
+        """Start playing frames centred on center, frame_time seconds per frame
+
+        A one-shot animation kills itself after its last frame and then calls
+        on_complete(); a looping one plays until it is killed.
+        """
+        super().__init__()
+        self.frames = frames
+        self.frame_time = frame_time
+        self.loop = loop
+        self.on_complete = on_complete
+
+        self.frame_index = 0
+        self.elapsed = 0.0
+        self.image = self.frames[0]
+        self.rect = self.image.get_rect(center=center)
+
+    def update(self, dt):
+        """Advance the animation by dt seconds"""
+        self.elapsed += dt
+        while self.elapsed >= self.frame_time:
+            self.elapsed -= self.frame_time
+            self.frame_index += 1
+            if self.frame_index >= len(self.frames):
+                if self.loop:
+                    self.frame_index = 0
+                else:
+                    self.kill()
+                    if self.on_complete:
+                        self.on_complete()
+                    return
+        self.image = self.frames[self.frame_index]
+
+    def draw(self, screen):
+        """Draw the current frame and return the area drawn"""
+        return screen.blit(self.image, self.rect)
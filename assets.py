@@ -0,0 +1,275 @@
+import os
+import weakref
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import pygame
+from bundle import AssetBundle
+from rotation import RotationCache
+
+class AssetManager:
+    """A class to load, convert and cache game images so sprites can share them"""
+
+    def __init__(self, ak_game):
+        """Initialize an empty cache bounded by the configured memory budget"""
+        self.settings = ak_game.settings
+        self.max_bytes = self.settings.asset_cache_bytes
+
+        # (path, size, mode) -> Surface, least recently used first
+        self._cache = OrderedDict()
+        self.cached_bytes = 0
+        self._fonts = {}  # size -> Font; fonts are small, so they are never evicted
+        self._sounds = {}  # path -> Sound; never evicted either
+        self._rotations = {}  # (path, size, steps, tint) -> RotationCache; bounded by the step count
+        self._masks = weakref.WeakKeyDictionary()  # Surface -> Mask; dropped along with the surface
+        self._solid_masks = {}  # size -> fully set Mask
+        self._background = None  # Thread pool for loads nothing waits on; started by load_in_background()
+        self._loading = {}  # Future -> key of images being decoded on it
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bundle_loads = 0  # Misses served from the bundle instead of decoding a PNG
+
+        # Pre-baked images; without a usable bundle everything is decoded from the PNGs
+        self.bundle = None
+        path = self.settings.asset_bundle_path
+        if path and os.path.exists(path):
+            try:
+                self.bundle = AssetBundle(path)
+            except (OSError, ValueError) as error:
+                print(f"Ignoring asset bundle: {error}")
+
+    def image(self, path, size=None, mode='alpha'):
+        """Return a shared image for path scaled to size; callers must not draw on it
+
+        mode is 'alpha' for convert_alpha(), 'opaque' for convert() or None to
+        keep the surface in its decoded format.
+        """
+        return self._get((path, size, mode), lambda: self._load_image(path, size, mode))
+
+    def tinted(self, path, size, color, mode='alpha'):
+        """Return a shared copy of image(path, size, mode) multiplied by color"""
+        return self._get(('tinted', path, size, mode, color), lambda: self._make_tinted(path, size, mode, color))
+
+    def image_if_ready(self, path, size=None, mode='alpha'):
+        """Return image(path, size, mode) if it is loaded, otherwise None after starting it loading in the background"""
+        self._collect_background()
+        key = (path, size, mode)
+        if key in self._cache:
+            return self.image(path, size, mode)
+        self.load_in_background([key])
+        return None
+
+    def blank(self, size):
+        """Return a shared fully transparent surface of size"""
+        return self._get(('blank', size), lambda: pygame.Surface(size, pygame.SRCALPHA).convert_alpha())
+
+    def circle(self, radius, color):
+        """Return a shared colorkeyed surface with a filled circle of the given radius"""
+        return self._get(('circle', radius, color), lambda: self._make_circle(radius, color))
+
+    def rotations(self, path, size, steps, tint=None):
+        """Return the shared RotationCache of image(path, size) at steps angles, with flash frames if tint is given"""
+        key = (path, size, steps, tint)
+        rotations = self._rotations.get(key)
+        if rotations is None:
+            flash_image = self.tinted(path, size, tint) if tint else None
+            rotations = self._rotations[key] = RotationCache(self.image(path, size), steps, flash_image)
+        return rotations
+
+    def mask(self, surface):
+        """Return the shared collision mask of a shared surface, building it on first use"""
+        mask = self._masks.get(surface)
+        if mask is None:
+            mask = self._masks[surface] = pygame.mask.from_surface(surface)
+        return mask
+
+    def solid_mask(self, size):
+        """Return a shared mask with every bit set, for sprites that fill their rect"""
+        mask = self._solid_masks.get(size)
+        if mask is None:
+            mask = self._solid_masks[size] = pygame.Mask(size, fill=True)
+        return mask
+
+    def font(self, size):
+        """Return a shared default font of the given size"""
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def sound(self, path):
+        """Return a shared Sound, decoding it now if it wasn't preloaded"""
+        sound = self._sounds.get(path)
+        if sound is None:
+            sound = self._sounds[path] = pygame.mixer.Sound(path)
+        return sound
+
+    def text(self, message, size, color):
+        """Return a shared antialiased rendering of message"""
+        return self._get(('text', message, size, color), lambda: self.font(size).render(message, True, color))
+
+    def preload(self, specs, sounds=(), progress=None):
+        """Load (path, size, mode) image specs and sound paths up front on a thread pool
+
+        Images in the bundle are taken from it directly; everything else is
+        decoded by settings.loader_threads threads. progress(done, total) is
+        called on this thread a few times a second until loading finishes, so
+        the caller can keep a loading screen drawn and the window responsive.
+        """
+        with ThreadPoolExecutor(max_workers=self.settings.loader_threads) as pool:
+            jobs = {}
+            for path, size, mode in specs:
+                key = (path, size, mode)
+                if key in self._cache:
+                    continue
+                surface = self._from_bundle(key)
+                if surface is not None:
+                    self._store(key, surface)
+                else:
+                    jobs[pool.submit(self._load_image, path, size, mode)] = key
+            for path in sounds:
+                if path not in self._sounds:
+                    jobs[pool.submit(pygame.mixer.Sound, path)] = path
+
+            total = len(specs) + len(sounds)
+            pending = set(jobs)
+            while True:
+                if progress is not None:
+                    progress(total - len(pending), total)
+                if not pending:
+                    break
+                finished, pending = wait(pending, timeout=1 / 30, return_when=FIRST_COMPLETED)
+                # The cache is only ever touched from this thread
+                for future in finished:
+                    key = jobs[future]
+                    if isinstance(key, tuple):
+                        self._store(key, future.result())
+                    else:
+                        self._sounds[key] = future.result()
+
+    def load_in_background(self, specs):
+        """Start decoding (path, size, mode) image specs off the main thread without waiting
+
+        image_if_ready() returns each one once it has finished. Images in the
+        bundle are taken from it straight away.
+        """
+        if self._background is None:
+            self._background = ThreadPoolExecutor(max_workers=self.settings.loader_threads)
+        loading = set(self._loading.values())
+        for path, size, mode in specs:
+            key = (path, size, mode)
+            if key in self._cache or key in loading:
+                continue
+            surface = self._from_bundle(key)
+            if surface is not None:
+                self._store(key, surface)
+            else:
+                self._loading[self._background.submit(self._load_image, path, size, mode)] = key
+
+    def stats(self):
+        """Return a snapshot of the cache counters"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'bundle_loads': self.bundle_loads,
+            'rotation_bytes': sum(rotations.bytes() for rotations in self._rotations.values()),
+            'entries': len(self._cache),
+            'bytes': self.cached_bytes,
+        }
+
+    def entries(self):
+        """(key, surface) for every cached surface"""
+        return list(self._cache.items())
+
+    @staticmethod
+    def bundle_source(key):
+        """The PNG a cache key is made from if it can be bundled, otherwise None"""
+        if key[0] == 'tinted':
+            _, path, _, mode, _ = key
+        elif key[0] in ('circle', 'text', 'blank'):
+            return None
+        else:
+            path, _, mode = key
+        return path if mode == 'alpha' else None  # Only per-pixel alpha images share the bundle's format
+
+    def clear(self):
+        """Drop every cached surface"""
+        self._cache.clear()
+        self.cached_bytes = 0
+
+    def _get(self, key, build):
+        """Look key up in the cache, building and storing it on a miss"""
+        surface = self._cache.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return surface
+
+        surface = self._from_bundle(key)
+        if surface is None:
+            surface = build()
+        self._store(key, surface)
+        return surface
+
+    def _collect_background(self):
+        """Cache the background loads that have finished; the cache is only ever touched from the main thread"""
+        for future in [future for future in self._loading if future.done()]:
+            self._store(self._loading.pop(future), future.result())
+
+    def _store(self, key, surface):
+        """Add a newly built surface to the cache"""
+        self.misses += 1
+        self._cache[key] = surface
+        self.cached_bytes += self._surface_bytes(surface)
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits its budget"""
+        # Always keep the newest entry, even if it alone is over budget
+        while self.cached_bytes > self.max_bytes and len(self._cache) > 1:
+            _, surface = self._cache.popitem(last=False)
+            self.cached_bytes -= self._surface_bytes(surface)
+            self.evictions += 1
+
+    def _from_bundle(self, key):
+        """The pre-baked surface for key, or None when it has to be built"""
+        if self.bundle is None:
+            return None
+        source = self.bundle_source(key)
+        surface = self.bundle.surface(key, source) if source else None
+        if surface is not None:
+            self.bundle_loads += 1
+        return surface
+
+    def _load_image(self, path, size, mode):
+        """Decode, convert and scale an image from disk"""
+        image = pygame.image.load(path)
+        if mode == 'alpha':
+            image = image.convert_alpha()
+        elif mode == 'opaque':
+            image = image.convert()
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        return image
+
+    def _make_tinted(self, path, size, mode, color):
+        """Copy the base image and tint it"""
+        image = self.image(path, size, mode).copy()
+        image.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
+        return image
+
+    def _make_circle(self, radius, color):
+        """Draw a circle on a colorkeyed surface"""
+        image = pygame.Surface((radius * 2, radius * 2)).convert()
+        image.fill((0, 0, 0))
+        image.set_colorkey((0, 0, 0), pygame.RLEACCEL)  # Set transparency; RLE makes repeated blits cheaper
+        pygame.draw.circle(image, color, (radius, radius), radius)
+        return image
+
+    @staticmethod
+    def _surface_bytes(surface):
+        """Approximate memory used by a surface's pixels"""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
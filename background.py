@@ -0,0 +1,112 @@
+import random
+import pygame
+
+class Background:
+    """A class to manage the pre-rendered background layer (gradient, stars and borders)"""
+
+    def __init__(self, ak_game):
+        """Initialize the background layer; the surface is baked lazily on first draw"""
+        self.game = ak_game  # Keep the game so a re-created display surface is picked up
+        self.settings = ak_game.settings
+
+        self.surface = None
+        self._key = None
+        self.show_stars = True  # Switched off by the frame pacer's quality tiers
+
+    def _settings_key(self):
+        """Everything the baked surface depends on; a change here triggers a re-bake"""
+        return (
+            self.game.screen.get_size(),
+            self.settings.screen_width,
+            self.settings.screen_height,
+            self.settings.gradient_start_color,
+            self.settings.gradient_end_color,
+            self.settings.star_count,
+            self.show_stars,
+            self.settings.star_color,
+            self.settings.star_seed,
+            self.settings.outer_border_color,
+            self.settings.outer_border_thickness,
+            self.settings.inner_border_color,
+            self.settings.inner_border_thickness,
+        )
+
+    def invalidate(self):
+        """Force the layer to be rebuilt on the next draw"""
+        self._key = None
+
+    def _bake(self):
+        """Render gradient, starfield and borders into a cached surface"""
+        self.surface = pygame.Surface(self.game.screen.get_size()).convert()
+        self._draw_gradient()
+        if self.show_stars:
+            self._draw_stars()
+        self._draw_borders()
+
+    def _draw_gradient(self):
+        """Draw a vertical gradient from start_color to end_color"""
+        height = self.settings.screen_height
+        width = self.settings.screen_width
+        start_color = self.settings.gradient_start_color
+        end_color = self.settings.gradient_end_color
+
+        for i in range(height):
+            ratio = i / height
+            intermediate_color = (
+                int(start_color[0] * (1 - ratio) + end_color[0] * ratio),
+                int(start_color[1] * (1 - ratio) + end_color[1] * ratio),
+                int(start_color[2] * (1 - ratio) + end_color[2] * ratio)
+            )
+            pygame.draw.line(self.surface, intermediate_color, (0, i), (width, i))
+
+    def _draw_stars(self):
+        """Simulate stars; a fixed seed keeps the starfield stable between bakes"""
+        rng = random.Random(self.settings.star_seed)
+        for _ in range(self.settings.star_count):
+            star_x = rng.randint(0, self.settings.screen_width)
+            star_y = rng.randint(0, self.settings.screen_height)
+            pygame.draw.circle(self.surface, self.settings.star_color, (star_x, star_y), 1)  # Small dots
+
+    def _draw_borders(self):
+        """Draw both outer and inner borders."""
+        # Draw the outer border
+        pygame.draw.rect(
+            self.surface,
+            self.settings.outer_border_color,
+            (self.settings.outer_border_thickness // 2,
+            self.settings.outer_border_thickness // 2,
+            self.settings.screen_width - self.settings.outer_border_thickness,
+            self.settings.screen_height - self.settings.outer_border_thickness),
+            self.settings.outer_border_thickness
+        )
+
+        # Draw the inner border (inset from the outer border)
+        pygame.draw.rect(
+            self.surface,
+            self.settings.inner_border_color,
+            (self.settings.outer_border_thickness + self.settings.inner_border_thickness // 2,
+            self.settings.outer_border_thickness + self.settings.inner_border_thickness // 2,
+            self.settings.screen_width - 2 * self.settings.outer_border_thickness - self.settings.inner_border_thickness,
+            self.settings.screen_height - 2 * self.settings.outer_border_thickness - self.settings.inner_border_thickness),
+            self.settings.inner_border_thickness
+        )
+
+    def refresh(self):
+        """Re-bake the cached layer if the settings changed; returns True when it did"""
+        key = self._settings_key()
+        if key == self._key:
+            return False
+        self._bake()
+        self._key = key
+        return True
+
+    def draw(self):
+        """Blit the cached layer to the screen, re-baking it if the settings changed"""
+        self.refresh()
+        self.game.screen.blit(self.surface, (0, 0))
+
+    def restore(self, rects):
+        """Copy the background back over the given screen areas"""
+        screen = self.game.screen
+        for rect in rects:
+            screen.blit(self.surface, rect, rect)
@@ -0,0 +1,89 @@
+"""Compare brute-force and spatial-hash collision checks as entity counts grow
+
+It also times both collision modes: the rect test alone ('rect'), and the
+rect test followed by a cached-mask test on overlapping pairs ('mask').
+
+Run from the project root:  python -m benchmarks.collisions
+"""
+import random
+import time
+import pygame
+from alien_kitty import AlienKitty
+from octo import Octo
+from spatial_hash import SpatialHash, collide_mask, hashed_groupcollide, hashed_spritecollide
+
+ENTITY_COUNTS = (10, 100, 1000, 5000)
+REPEATS = 20
+
+
+def _populate(ak, rng, count):
+    """Fill the game with count bullets, count // 5 minions and count projectiles"""
+    width, height = ak.settings.screen_width, ak.settings.screen_height
+    for sprite in [*ak.bullets, *ak.projectiles]:
+        sprite.kill()  # Back to the pools, and out of the projectile grid
+    ak.octo.empty()
+    for _ in range(count):
+        bullet = ak.bullet_pool.acquire()
+        bullet.rect.topleft = (rng.randrange(width), rng.randrange(height))
+        ak.bullets.add(bullet)
+
+        projectile = ak.projectile_pool.acquire()
+        projectile.reset(rng.randrange(width), rng.randrange(height))
+        ak.projectiles.add(projectile)
+        ak.projectile_grid.insert(projectile)
+    for _ in range(max(1, count // 5)):
+        ak.octo.add(Octo(ak, 'images/AlienOctoSmall.png', rng.randrange(width), rng.randrange(height)))
+
+
+def _time(func):
+    """Best-of-REPEATS wall time of func() in milliseconds, and its last result"""
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    ak = AlienKitty(headless=True)
+    rng = random.Random(1234)
+    grid = SpatialHash(ak.settings.spatial_hash_cell_size)
+
+    counts = {}
+    print(f"{'entities':>8} {'check':<18} {'brute ms':>10} {'hashed ms':>10} {'speedup':>8}")
+    for count in ENTITY_COUNTS:
+        _populate(ak, rng, count)
+
+        brute_ms, brute = _time(lambda: pygame.sprite.groupcollide(ak.bullets, ak.octo, False, False))
+        hashed_ms, hashed = _time(lambda: hashed_groupcollide(grid, ak.bullets, ak.octo, False))
+        assert brute == hashed, 'bullet/octo results differ'
+        print(f"{count:>8} {'bullet/octo':<18} {brute_ms:>10.3f} {hashed_ms:>10.3f} {brute_ms / hashed_ms:>7.1f}x")
+
+        brute_ms, brute = _time(lambda: pygame.sprite.spritecollide(ak.kitty, ak.projectiles, False))
+        hashed_ms, hashed = _time(lambda: hashed_spritecollide(ak.projectile_grid, ak.kitty, False))
+        assert brute == hashed, 'projectile/kitty results differ'
+        print(f"{count:>8} {'projectile/kitty':<18} {brute_ms:>10.3f} {hashed_ms:>10.3f} {brute_ms / hashed_ms:>7.1f}x")
+        counts[count] = _time_modes(ak, grid)
+
+    print()
+    print(f"{'entities':>8} {'check (hashed)':<18} {'rect ms':>10} {'mask ms':>10} {'hits rect':>10} {'hits mask':>10}")
+    for count, rows in counts.items():
+        for name, (rect_ms, rect_hits, mask_ms, mask_hits) in rows.items():
+            print(f"{count:>8} {name:<18} {rect_ms:>10.3f} {mask_ms:>10.3f} {rect_hits:>10} {mask_hits:>10}")
+
+
+def _time_modes(ak, grid):
+    """Time both checks with and without the mask test; returns {check: (ms, hits, ms, hits)}"""
+    rows = {}
+    rect_ms, rect = _time(lambda: hashed_groupcollide(grid, ak.bullets, ak.octo, False))
+    mask_ms, mask = _time(lambda: hashed_groupcollide(grid, ak.bullets, ak.octo, False, collide_mask))
+    rows['bullet/octo'] = (rect_ms, sum(map(len, rect.values())), mask_ms, sum(map(len, mask.values())))
+    rect_ms, rect = _time(lambda: hashed_spritecollide(ak.projectile_grid, ak.kitty, False))
+    mask_ms, mask = _time(lambda: hashed_spritecollide(ak.projectile_grid, ak.kitty, False, collide_mask))
+    rows['projectile/kitty'] = (rect_ms, len(rect), mask_ms, len(mask))
+    return rows
+
+
+if __name__ == '__main__':
+    main()
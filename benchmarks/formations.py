@@ -0,0 +1,57 @@
+"""Compare the old per-minion orbit loop with the list and NumPy formation engines
+
+Run from the project root:  python -m benchmarks.formations
+"""
+import math
+import time
+from alien_kitty import AlienKitty
+
+# (bosses, minions per boss)
+SWARMS = ((1, 200), (4, 250), (5, 1000))
+FRAMES = 60
+
+
+def _legacy_update(ak):
+    """The orbit step as it was before formations: filter octo by type, then trigonometry per minion"""
+    boss_octo = next((o for o in ak.octo if o.octo_type == 'boss'), None)
+    cx, cy = boss_octo.rect.center
+    minion_width = minion_height = ak.settings.small_alien_size[0]
+    radius = ak._calculate_fixed_radius(cx, cy, minion_width, minion_height)
+    for octo in (o for o in ak.octo if o.octo_type == 'small'):
+        octo.angle = (octo.angle + ak.settings.minion_orbit_speed * ak.dt) % 360
+        rad_angle = math.radians(octo.angle)
+        octo.rect.x = cx + radius * math.cos(rad_angle) - octo.rect.width / 2
+        octo.rect.y = cy + radius * math.sin(rad_angle) - octo.rect.height / 2
+        octo.heading = (180 - octo.angle) % 360
+
+
+def _formation_update(ak):
+    for formation in ak.formations.values():
+        formation.update(ak.dt)
+
+
+def _per_frame_ms(ak, update):
+    """Average milliseconds per frame spent moving every minion"""
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        update(ak)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    for bosses, per_boss in SWARMS:
+        times = {}
+        for engine in ('python', 'numpy'):
+            ak = AlienKitty(headless=True, overrides={
+                'seed': 1, 'formation_engine': engine, 'boss_count': bosses,
+                'minion_formation': (('rings', (per_boss // 2, per_boss - per_boss // 2)),),
+            })
+            if engine == 'python':
+                times['legacy'] = _per_frame_ms(ak, _legacy_update)  # Orbits the first boss only
+            times[engine] = _per_frame_ms(ak, _formation_update)
+        print(f"{bosses} x {per_boss:>4} minions: legacy {times['legacy']:7.2f} ms/frame, "
+              f"list {times['python']:7.2f} ms/frame, numpy {times['numpy']:7.2f} ms/frame")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""Reproducible headless benchmarks of the whole game loop
+
+Each scenario runs _check_events, _update_game and _render_objects for a
+fixed number of frames under the SDL dummy drivers. It uses a seeded RNG
+and scripted key presses. It reports frames per second, per-phase timings
+from the FrameProfiler and peak Python memory from tracemalloc. Results
+are compared against a saved baseline, and any regression beyond the
+tolerance, or a missing baseline, makes the run exit with status 1.
+
+Run from the project root:
+    python -m benchmarks.game_loop                    # run all, compare to the baseline
+    python -m benchmarks.game_loop --save-baseline    # record a new baseline on this machine
+    python -m benchmarks.game_loop hit_flash --frames 300
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+import pygame
+from alien_kitty import AlienKitty
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+SEED = 1234
+
+# Long fights: nobody should die mid-benchmark
+DURABLE = {'max_kitty_health': 10 ** 6, 'max_boss_health': 10 ** 6, 'max_minion_health': 10 ** 6}
+
+
+def _strafe_and_fire(frame):
+    """Walk left and right across the screen, firing every 10 frames"""
+    keys_down, keys_up = [], []
+    if frame % 240 == 0:
+        keys_up.append(pygame.K_RIGHT)
+        keys_down.append(pygame.K_LEFT)
+    elif frame % 240 == 120:
+        keys_up.append(pygame.K_LEFT)
+        keys_down.append(pygame.K_RIGHT)
+    if frame % 10 == 0:
+        keys_down.append(pygame.K_SPACE)
+    return keys_down, keys_up
+
+
+def _fire_every_frame(frame):
+    """Stand still under the boss and keep firing"""
+    return [pygame.K_SPACE], []
+
+
+def _add_minions(ak, rng):
+    """Surround the boss with 200 minions"""
+    ak._create_octo_circle(ak.boss_octo, 195)
+
+
+def _add_projectiles(ak, rng):
+    """Fill the screen with 5,000 projectiles fired through the real Octo.shoot path"""
+    shooter = ak.boss_octo
+    home = shooter.rect.copy()
+    for _ in range(5000):
+        shooter.rect.centerx = rng.randrange(ak.settings.screen_width)
+        shooter.rect.bottom = rng.randrange(ak.settings.screen_height // 2)
+        shooter.shoot()
+    shooter.rect = home
+
+
+def _center_kitty(ak, rng):
+    """Put the kitty right under the boss so every bullet hits"""
+    ak.kitty.rect.centerx = ak.boss_octo.rect.centerx
+    ak.kitty.x = float(ak.kitty.rect.x)
+
+
+# name -> (settings overrides, setup(ak, rng), script(frame) -> (keys down, keys up))
+SCENARIOS = {
+    'boss_fight': (DURABLE, None, _strafe_and_fire),
+    'minions_200': (DURABLE, _add_minions, _strafe_and_fire),
+    'projectiles_5000': (DURABLE, _add_projectiles, _strafe_and_fire),
+    'projectiles_5000_numpy': ({**DURABLE, 'projectile_engine': 'numpy'}, _add_projectiles, _strafe_and_fire),
+    'hit_flash': ({**DURABLE, 'bullets_allowed': 50}, _center_kitty, _fire_every_frame),
+}
+
+
+def _make_game(name, frames):
+    """Build a headless game for a scenario with all randomness seeded"""
+    overrides, setup, _ = SCENARIOS[name]
+    ak = AlienKitty(headless=True, overrides={**overrides, 'seed': SEED, 'profiler_window': frames})
+    if setup:
+        setup(ak, random.Random(SEED))
+    return ak
+
+
+def _play(ak, script, frames):
+    """Drive the full loop for frames frames with scripted key events"""
+    for frame in range(frames):
+        keys_down, keys_up = script(frame)
+        for key in keys_up:
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key))
+        for key in keys_down:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+        ak._check_events()
+        ak._store_previous_positions()
+        ak._update_game()
+        ak._render_objects()
+        if ak.profiler.enabled:
+            ak.profiler.end_frame()
+
+
+def run_scenario(name, frames):
+    """Run a scenario twice: once timed with the profiler, once under tracemalloc"""
+    script = SCENARIOS[name][2]
+
+    ak = _make_game(name, frames)
+    ak.profiler.enable()
+    start = time.perf_counter()
+    _play(ak, script, frames)
+    elapsed = time.perf_counter() - start
+    phases = {phase: round(p50, 4) for phase, (p50, _, _) in ak.profiler.summary().items()}
+    ak.profiler.disable()
+
+    # Separate pass so tracemalloc's overhead doesn't skew the timings
+    ak = _make_game(name, frames)
+    tracemalloc.start()
+    _play(ak, script, frames)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'fps': round(frames / elapsed, 1), 'peak_kib': round(peak / 1024, 1), 'phases_p50_ms': phases}
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regressions against baseline"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result['fps'] < base['fps'] * (1 - tolerance):
+            regressions.append(f"{name}: {result['fps']} fps, baseline {base['fps']} fps")
+        if result['peak_kib'] > base['peak_kib'] * (1 + tolerance):
+            regressions.append(f"{name}: peak {result['peak_kib']} KiB, baseline {base['peak_kib']} KiB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('scenarios', nargs='*', help=f"scenarios to run (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='allowed slowdown / memory growth (0.15 = 15%%)')
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in args.scenarios or SCENARIOS:
+        result = results[name] = run_scenario(name, args.frames)
+        print(f"{name:<24} {result['fps']:>9.1f} fps {result['peak_kib']:>10.1f} KiB peak")
+        for phase, p50 in result['phases_p50_ms'].items():
+            print(f"    {phase:<32} {p50:>8.3f} ms p50")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        # Failing rather than passing by default, so a check with no baseline can't go unnoticed
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        sys.exit(1)
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    if regressions:
+        print('PERFORMANCE REGRESSION:')
+        for regression in regressions:
+            print(f"    {regression}")
+        sys.exit(1)
+    print('No regressions against the baseline')
+
+
+if __name__ == '__main__':
+    main()
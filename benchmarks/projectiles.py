@@ -0,0 +1,56 @@
+"""Compare the sprite and NumPy projectile engines at bullet-hell densities
+
+Run from the project root:  python -m benchmarks.projectiles
+"""
+import random
+import time
+from alien_kitty import AlienKitty
+
+PROJECTILE_COUNTS = (100, 1000, 10000)
+FRAMES = 60
+
+
+def _make_game(engine, count, seed):
+    """A headless game with count projectiles spread over the top of the screen"""
+    ak = AlienKitty(headless=True, overrides={'projectile_engine': engine})
+    ak.kitty.health = float('inf')  # Keep the run going whatever hits
+
+    rng = random.Random(seed)
+    shooter = ak.boss_octo
+    for _ in range(count):
+        # Fire through the real Octo.shoot path from random spots
+        shooter.rect.centerx = rng.randrange(ak.settings.screen_width)
+        shooter.rect.bottom = rng.randrange(ak.settings.screen_height // 2)
+        shooter.shoot()
+    return ak
+
+
+def _run(ak):
+    """Average milliseconds per frame for update+collide and for drawing"""
+    update_time = draw_time = 0.0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        ak._update_projectiles()
+        update_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        if ak.projectile_array is not None:
+            ak.projectile_array.draw()
+        for projectile in ak.projectiles:
+            projectile.draw_projectile()
+        draw_time += time.perf_counter() - start
+    return update_time * 1000 / FRAMES, draw_time * 1000 / FRAMES
+
+
+def main():
+    print(f"{'projectiles':>11} {'engine':<7} {'update ms':>10} {'draw ms':>9} {'total ms':>9} {'alive':>6}")
+    for count in PROJECTILE_COUNTS:
+        for engine in ('sprite', 'numpy'):
+            ak = _make_game(engine, count, seed=count)
+            update_ms, draw_ms = _run(ak)
+            alive = ak.get_state()['projectiles']
+            print(f"{count:>11} {engine:<7} {update_ms:>10.3f} {draw_ms:>9.3f} {update_ms + draw_ms:>9.3f} {alive:>6}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Measure rendering at each internal resolution
+
+For each render_scale it reports the milliseconds per frame spent drawing a
+busy scene (200 minions and their bars) at the internal resolution, and what
+scaling the frame back up to the 900x800 window costs when that is done in
+software ('blit' mode). With pygame.SCALED the upscale happens in SDL instead.
+
+Run from the project root:  python -m benchmarks.render_scale
+"""
+import time
+import pygame
+from alien_kitty import AlienKitty
+
+SCALES = (1.0, 0.75, 0.5)
+FRAMES = 120
+
+
+def _per_frame_ms(draw):
+    """Average milliseconds per call of draw over FRAMES calls"""
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        draw()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    print(f"{'scale':>6}{'internal':>11}{'pixels':>8}{'render ms':>11}{'upscale ms':>12}")
+    for scale in SCALES:
+        ak = AlienKitty(headless=True, overrides={'render_scale': scale, 'seed': 1})
+        ak._create_octo_circle(ak.boss_octo, 195)
+        ak.step(30)  # Get some projectiles on screen
+
+        width, height = ak.screen.get_size()
+        window = pygame.Surface((round(width / scale), round(height / scale)), 0, ak.screen)
+        render = _per_frame_ms(ak._render_objects)
+        upscale = '-'  # Drawn straight to the window
+        if scale != 1:
+            upscale = f"{_per_frame_ms(lambda: pygame.transform.scale(ak.screen, window.get_size(), window)):.2f}"
+        share = width * height / (window.get_width() * window.get_height())
+        print(f"{scale:>6.2f}{f'{width}x{height}':>11}{share:>8.0%}{render:>11.2f}{upscale:>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Compare rotating minions every frame with looking up the pre-rotated cache
+
+Run from the project root:  python -m benchmarks.rotation
+"""
+import time
+import pygame
+from alien_kitty import AlienKitty
+
+MINION_COUNTS = (5, 50, 200)
+FRAMES = 120
+
+
+def _per_frame_ms(minions, rotate):
+    """Average milliseconds per frame spent turning every minion"""
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        for minion in minions:
+            minion.heading = (minion.heading + 1.0) % 360
+            rotate(minion)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    ak = AlienKitty(headless=True)
+    ak._create_octo_circle(ak.boss_octo, max(MINION_COUNTS) - 5)
+    all_minions = ak.minions.sprites()
+    rotations = all_minions[0].rotations
+    print(f"Cache: {rotations.steps} angles, {ak.assets.stats()['rotation_bytes'] / 2 ** 20:.1f} MiB shared by all minions")
+
+    def naive(minion):
+        minion.image = pygame.transform.rotozoom(minion.original_image, minion.heading, 1.0)
+        minion.rect = minion.image.get_rect(center=minion.rect.center)
+        minion.mask = pygame.mask.from_surface(minion.image)
+
+    def cached(minion):
+        minion._face_heading(False)
+
+    for count in MINION_COUNTS:
+        minions = all_minions[:count]
+        print(f"{count:>4} minions: rotozoom {_per_frame_ms(minions, naive):8.3f} ms/frame, "
+              f"cache {_per_frame_ms(minions, cached):8.3f} ms/frame")
+
+
+if __name__ == '__main__':
+    main()
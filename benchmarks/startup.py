@@ -0,0 +1,53 @@
+"""Measure cold start: fresh interpreters building a headless game, with and without the asset bundle
+
+Each run is a new Python process, so imports, pygame initialisation and
+asset loading are all paid again; the phases are AlienKitty.startup_timings.
+The operating system's file cache stays warm, so disk reads are not included.
+
+Run from the project root after `python bundle.py`:  python -m benchmarks.startup [--runs 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Runs in the child; prints phase timings in milliseconds as JSON
+CHILD = '''
+import json, sys, time
+start = time.perf_counter()
+from alien_kitty import AlienKitty
+imports = (time.perf_counter() - start) * 1000
+ak = AlienKitty(headless=True, overrides={'asset_bundle_path': sys.argv[1] or None})
+print(json.dumps({'imports': imports, **ak.startup_timings}))
+'''
+PHASES = ('imports', 'init', 'display', 'assets', 'world', 'total')
+
+
+def _run(bundle_path, runs):
+    """Median of each phase over runs fresh processes"""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', CHILD, bundle_path], capture_output=True, text=True,
+                                check=True, env={**os.environ, 'PYGAME_HIDE_SUPPORT_PROMPT': '1'}).stdout
+        samples.append(json.loads(output.splitlines()[-1]))
+    return {phase: statistics.median(sample[phase] for sample in samples) for phase in samples[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--bundle', default='assets.bundle')
+    args = parser.parse_args()
+    if not os.path.exists(args.bundle):
+        parser.error(f"{args.bundle} not found; build it with `python bundle.py`")
+
+    print(f"{'':<12}" + ''.join(f"{phase:>10}" for phase in PHASES) + f"   (ms, median of {args.runs})")
+    for label, path in (('PNG', ''), ('bundle', args.bundle)):
+        result = _run(path, args.runs)
+        print(f"{label:<12}" + ''.join(f"{result[phase]:>10.1f}" for phase in PHASES))
+
+
+if __name__ == '__main__':
+    main()
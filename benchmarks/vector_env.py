@@ -0,0 +1,62 @@
+"""Measure training throughput of one environment against VectorEnv pools
+
+Every configuration plays random actions for the same number of agent
+steps per environment and reports actions and simulation frames per second.
+
+Run from the project root:  python -m benchmarks.vector_env [--envs 8] [--steps 500]
+"""
+import argparse
+import multiprocessing
+import time
+import numpy as np
+from env import ACTIONS, OBSERVATIONS, AlienKittyEnv, VectorEnv
+
+
+def _run_single(observation, steps):
+    """Actions per second and frame skip of a single in-process environment"""
+    env = AlienKittyEnv(observation, seed=0)
+    env.reset(seed=0)
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    for action in rng.integers(len(ACTIONS), size=steps):
+        _, _, terminated, truncated, _ = env.step(action)
+        if terminated or truncated:
+            env.reset()
+    return steps / (time.perf_counter() - start), env.settings.env_frame_skip
+
+
+def _run_vector(observation, envs, processes, steps):
+    """Actions per second summed over every environment in a VectorEnv"""
+    rng = np.random.default_rng(0)
+    with VectorEnv(envs, observation, processes=processes, seed=0) as vector:
+        vector.reset(seed=0)
+        start = time.perf_counter()
+        for _ in range(steps):
+            vector.step(rng.integers(len(ACTIONS), size=envs))
+        return steps * envs / (time.perf_counter() - start)
+
+
+def main():
+    cores = multiprocessing.cpu_count()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--envs', type=int, default=max(cores, 2))
+    parser.add_argument('--steps', type=int, default=500, help='agent steps per environment')
+    parser.add_argument('--observation', choices=OBSERVATIONS, default='state')
+    args = parser.parse_args()
+
+    single, frame_skip = _run_single(args.observation, args.steps)
+    print(f"{'1 env, in process':<28} {single:>9.0f} actions/s {single * frame_skip:>10.0f} frames/s")
+
+    processes = 1
+    while True:
+        rate = _run_vector(args.observation, args.envs, processes, args.steps)
+        label = f"{args.envs} envs, {processes} process{'es' if processes > 1 else ''}"
+        print(f"{label:<28} {rate:>9.0f} actions/s {rate * frame_skip:>10.0f} frames/s")
+        if processes >= min(cores, args.envs):
+            break
+        processes = min(processes * 2, cores, args.envs)
+    print(f"({cores} cores available)")
+
+
+if __name__ == '__main__':
+    main()
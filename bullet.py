@@ -2,30 +2,50 @@ import pygame
 from pygame.sprite import Sprite
 
 class Bullet(Sprite):
-    """A class to manage bullets fired by kitty"""
+    """A class to manage bullets fired by kitty
+
+    Bullets are recycled through the game's bullet_pool; kill() hands them back.
+    Sprite itself keeps a __dict__, so __slots__ only covers the fields below.
+    """
+
+    __slots__ = ('game', 'screen', 'settings', 'color', 'pool', 'rect', 'mask', 'y', 'previous_topleft')
 
     def __init__(self, ak_game):
         """Create a bullet object at kittys current position"""
         super().__init__()
+        self.game = ak_game
         self.screen = ak_game.screen
         self.settings = ak_game.settings
         self.color = self.settings.bullet_color
+        self.pool = ak_game.bullet_pool
 
         # Create a bullet rectangle at (0, 0) and then set correct position
         self.rect = pygame.Rect(0, 0, self.settings.bullet_width, self.settings.bullet_height)
-        self.rect.midtop = ak_game.kitty.rect.midtop
+        self.mask = ak_game.assets.solid_mask(self.rect.size)
+        self.reset()
+
+    def reset(self):
+        """Move a new or recycled bullet to kittys current position"""
+        self.rect.midtop = self.game.kitty.rect.midtop
+        self.previous_topleft = self.rect.topleft
 
         # Store the kittys position as a float
         self.y = float(self.rect.y)
 
-    def update(self):
-        """Update bullet position and check for boundaries"""
-        self.y -= self.settings.bullet_speed 
+    def update(self, dt):
+        """Update bullet position and check for boundaries; dt is the step length in seconds"""
+        self.y -= self.settings.bullet_speed * dt
         if self.rect.y <= self.settings.margin + self.settings.outer_border_thickness + 2 * self.settings.inner_border_thickness:
             self.kill()  # Remove bullet if it goes above the top margin
         else:
             self.rect.y = self.y
 
+    def kill(self):
+        """Remove the bullet from its groups and return it to the pool"""
+        if self.alive():
+            super().kill()
+            self.pool.release(self)
+
     def draw_bullet(self):
-        """Draw the bullet to the screen"""
-        pygame.draw.rect(self.screen, self.color, self.rect)
\ No newline at end of file
+        """Draw the bullet to the screen and return the area drawn"""
+        return pygame.draw.rect(self.screen, self.color, self.rect)
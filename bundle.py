@@ -0,0 +1,131 @@
+"""Pre-baked asset bundle: every image already scaled and in the display's pixel format
+
+Build it from the project root after changing images or their sizes:
+    python bundle.py
+
+The game maps the bundle with mmap and wraps each entry with
+pygame.image.frombuffer, so startup does no PNG decoding or scaling. Entries
+whose source image changed since the build, or that were baked for another
+pixel format, are ignored and the PNG is loaded instead.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+import pygame
+
+MAGIC = b'AKAB'
+VERSION = 1
+HEADER = struct.Struct('<4sHI')  # magic, version, index length
+ALIGNMENT = 64                   # Entries start on cache-line boundaries
+
+
+def pixel_layout(masks):
+    """The frombuffer/tobytes format string for 32-bit pixels with these masks, or None"""
+    names = ['X'] * 4
+    for letter, mask in zip('RGBA', masks):
+        if mask:
+            shift = mask.bit_length() - 8
+            offset = shift // 8 if sys.byteorder == 'little' else 3 - shift // 8
+            names[offset] = letter
+    layout = ''.join(names)
+    return layout if layout in ('RGBA', 'BGRA', 'ARGB', 'RGBX') else None
+
+
+def _source_stamp(path):
+    """Size and modification time; a change in either marks the entry stale"""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class AssetBundle:
+    """A read-only view of a bundle file, mapped into memory"""
+
+    def __init__(self, path):
+        """Map path and read its index; raises OSError or ValueError if it can't be used"""
+        with open(path, 'rb') as f:
+            # Copy-on-write, so surfaces made from it are writable without touching the file
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, index_size = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} asset bundle")
+        index = json.loads(self._map[HEADER.size:HEADER.size + index_size])
+        self._data_start = HEADER.size + index_size
+        self._data_start += -self._data_start % ALIGNMENT
+        self.layout = index['layout']
+        if self.layout != display_layout():
+            raise ValueError(f"{path} was built for another display pixel format")
+        self.entries = index['entries']
+        self.sources = index['sources']
+        self._fresh = {}  # source path -> still matches the bundle
+
+    def surface(self, key, source):
+        """Return a surface for a cache key, or None if it isn't bundled or source changed"""
+        entry = self.entries.get(repr(key))
+        if entry is None or not self._is_fresh(source):
+            return None
+        offset, width, height = entry
+        offset += self._data_start
+        pixels = memoryview(self._map)[offset:offset + width * height * 4]
+        return pygame.image.frombuffer(pixels, (width, height), self.layout)
+
+    def _is_fresh(self, source):
+        fresh = self._fresh.get(source)
+        if fresh is None:
+            try:
+                fresh = self._fresh[source] = self.sources.get(source) == _source_stamp(source)
+            except OSError:
+                fresh = self._fresh[source] = False
+        return fresh
+
+
+def display_layout():
+    """The pixel layout convert_alpha() produces on the current display"""
+    return pixel_layout(pygame.Surface((1, 1)).convert_alpha().get_masks())
+
+
+def build(ak_game, path):
+    """Write every loaded image and tinted frame in the game's asset cache to a bundle at path"""
+    assets = ak_game.assets
+    layout = display_layout()
+    if layout is None:
+        raise ValueError('the display pixel format has no frombuffer equivalent')
+
+    entries, sources, blobs = {}, {}, []
+    offset = 0
+    for key, surface in assets.entries():
+        source = assets.bundle_source(key)
+        if source is None:
+            continue  # Drawn rather than loaded (circles, text); cheap to make at startup
+        pixels = pygame.image.tobytes(surface, layout)
+        entries[repr(key)] = [offset, surface.get_width(), surface.get_height()]
+        sources[source] = _source_stamp(source)
+        padding = -len(pixels) % ALIGNMENT
+        blobs.append(pixels + bytes(padding))
+        offset += len(pixels) + padding
+
+    index = json.dumps({'layout': layout, 'sources': sources, 'entries': entries}).encode()
+    padding = -(HEADER.size + len(index)) % ALIGNMENT
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        f.write(index)
+        f.write(bytes(padding))
+        for blob in blobs:
+            f.write(blob)
+    return len(entries), HEADER.size + len(index) + padding + offset
+
+
+def main():
+    from alien_kitty import AlienKitty
+    from settings import Settings
+
+    # Load everything from the PNGs, whatever bundle is there now; headless startup includes the blast frames
+    ak = AlienKitty(headless=True, overrides={'asset_bundle_path': None})
+    path = Settings().asset_bundle_path
+    count, size = build(ak, path)
+    print(f"Wrote {count} images ({size / 1024:.0f} KiB) to {path}")
+
+
+if __name__ == '__main__':
+    main()
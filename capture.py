@@ -0,0 +1,171 @@
+import queue
+import subprocess
+import sys
+import threading
+from contextlib import contextmanager
+import numpy as np
+import pygame
+
+class FrameCapture:
+    """A class to read the screen's pixels without copying the whole frame
+
+    view() exposes the display surface itself as a NumPy array. grab()
+    downsamples (by striding) and optionally grayscales straight from the
+    surface's memory into a preallocated ring buffer, so the only copy made
+    is the output frame. Colour frames keep the display's native 32-bit
+    pixels, which copies row by row instead of byte by byte; rgb() gives an
+    RGB view of them. Requires NumPy.
+    """
+
+    def __init__(self, ak_game, downsample=None, grayscale=None, ring_size=None):
+        """Allocate the ring buffer; arguments left as None come from settings"""
+        self.screen = ak_game.screen
+        self.settings = ak_game.settings
+        self.downsample = downsample or self.settings.capture_downsample
+        self.grayscale = self.settings.capture_grayscale if grayscale is None else grayscale
+        ring_size = ring_size or self.settings.capture_ring_size
+
+        # Byte offsets of red, green and blue inside a native pixel
+        shifts = [mask.bit_length() - 8 for mask in self.screen.get_masks()[:3]]
+        self.channel_offsets = [shift // 8 if sys.byteorder == 'little' else 3 - shift // 8 for shift in shifts]
+        if self.grayscale:
+            self.pixel_format = 'gray'
+        else:
+            layout = ['0'] * 4
+            for letter, offset in zip('rgb', self.channel_offsets):
+                layout[offset] = letter
+            self.pixel_format = ''.join(layout)  # e.g. 'bgr0', as ffmpeg names it
+
+        width, height = self.screen.get_size()
+        height, width = -(-height // self.downsample), -(-width // self.downsample)  # Rows and columns a stride keeps
+        self.frame_shape = (height, width)
+        self.ring = np.zeros((ring_size, height, width), dtype=np.uint8 if self.grayscale else np.uint32)
+        self.count = 0  # Frames grabbed so far; the newest is in slot (count - 1) % ring_size
+
+        if self.grayscale:
+            # Integer luma weights (ITU-R BT.601 scaled by 256) accumulated without temporaries
+            self._luma = np.zeros((height, width), dtype=np.uint16)
+            self._channel = np.zeros((height, width), dtype=np.uint16)
+
+    @contextmanager
+    def view(self):
+        """Yield the screen as a (height, width, 3) RGB uint8 array that shares its memory
+
+        The surface is locked, so nothing can be drawn to it, while the array is
+        alive; don't keep references to it after the block.
+        """
+        pixels = pygame.surfarray.pixels3d(self.screen)  # (width, height, 3) view, locks the surface
+        try:
+            yield pixels.transpose(1, 0, 2)
+        finally:
+            del pixels  # Unlocks the surface once the caller's references are gone too
+
+    def grab(self, out=None):
+        """Capture the current screen into the next ring slot (or into out) and return it"""
+        if out is None:
+            out = self.ring[self.count % len(self.ring)]
+            self.count += 1
+        pixels = pygame.surfarray.pixels2d(self.screen)  # (width, height) native pixels, locks the surface
+        try:
+            rows = pixels.T  # (height, width), still a view
+            if self.grayscale:
+                channels = rows.view(np.uint8).reshape(*rows.shape, 4)[::self.downsample, ::self.downsample]
+                red, green, blue = (channels[..., offset] for offset in self.channel_offsets)
+                luma, channel = self._luma, self._channel
+                np.multiply(red, 77, out=luma, dtype=np.uint16)
+                np.multiply(green, 150, out=channel, dtype=np.uint16)
+                luma += channel
+                np.multiply(blue, 29, out=channel, dtype=np.uint16)
+                luma += channel
+                np.right_shift(luma, 8, out=luma)
+                out[...] = luma
+            else:
+                out[...] = rows[::self.downsample, ::self.downsample]
+        finally:
+            del pixels
+        return out
+
+    def rgb(self, frame):
+        """A (height, width, 3) RGB view of a grabbed colour frame"""
+        channels = frame.view(np.uint8).reshape(*frame.shape, 4)
+        red, green, blue = self.channel_offsets
+        step = green - red
+        if step in (1, -1) and blue - green == step:
+            stop = blue + step
+            return channels[..., red:stop if stop >= 0 else None:step]  # Adjacent channels: a view
+        return channels[..., self.channel_offsets]
+
+    def latest(self, n=1):
+        """The last n grabbed frames, oldest first, as a (n, *frame_shape) copy"""
+        n = min(n, self.count, len(self.ring))
+        slots = [(self.count - n + i) % len(self.ring) for i in range(n)]
+        return self.ring[slots]
+
+
+class FrameWriter:
+    """A class to stream captured frames to a raw file or an encoder process
+
+    The game thread only grabs the frame into a free slot of the writer's own
+    ring and hands its index to a background thread, which does the slow
+    write. If the writer falls behind and every slot is still queued, the
+    frame is dropped rather than stalling the game loop.
+    """
+
+    def __init__(self, ak_game, path=None, command=None):
+        """Start writing to path, or to the stdin of command (an argument list)"""
+        self.capture = FrameCapture(ak_game, ring_size=ak_game.settings.capture_writer_slots)
+        self.frames_written = 0
+        self.dropped_frames = 0
+
+        if command is not None:
+            self._process = subprocess.Popen(command, stdin=subprocess.PIPE)
+            self._output = self._process.stdin
+        else:
+            self._process = None
+            self._output = open(path, 'wb')
+
+        self._free = queue.Queue()
+        for slot in range(len(self.capture.ring)):
+            self._free.put(slot)
+        self._pending = queue.Queue()
+        self._thread = threading.Thread(target=self._write_frames, daemon=True)
+        self._thread.start()
+
+    def write(self):
+        """Queue the current screen for writing; call after a frame is rendered"""
+        try:
+            slot = self._free.get_nowait()
+        except queue.Empty:
+            self.dropped_frames += 1  # Never stall the game loop on recording
+            return
+        self.capture.grab(self.capture.ring[slot])
+        self._pending.put(slot)
+
+    def _write_frames(self):
+        """Writer thread: write queued slots in order until told to stop"""
+        ring = self.capture.ring
+        while True:
+            slot = self._pending.get()
+            if slot is None:
+                break
+            self._output.write(ring[slot].data)  # Straight from the ring; file writes release the GIL
+            self.frames_written += 1
+            self._free.put(slot)
+
+    def close(self):
+        """Flush the queued frames and close the file or encoder"""
+        if self._thread is None:
+            return
+        self._pending.put(None)
+        self._thread.join()
+        self._thread = None
+        self._output.close()
+        if self._process is not None:
+            self._process.wait()
+
+
+def ffmpeg_command(capture, fps, path):
+    """An ffmpeg command line that encodes FrameWriter's raw frames into path"""
+    height, width = capture.frame_shape
+    return ['ffmpeg', '-loglevel', 'error', '-y', '-f', 'rawvideo', '-pix_fmt', capture.pixel_format,
+            '-s', f'{width}x{height}', '-r', str(fps), '-i', '-', '-pix_fmt', 'yuv420p', path]
@@ -0,0 +1,290 @@
+"""Reset/step training environments around a headless AlienKitty
+
+AlienKittyEnv follows the Gym API (reset() -> (obs, info), step(action) ->
+(obs, reward, terminated, truncated, info)) without depending on gym. It
+has four discrete actions, and observations are a 'state' vector or a
+downscaled RGB 'frame'. The reward is octo health taken minus kitty health
+lost, weighted by the env_reward_* settings.
+
+VectorEnv runs N independent environments across worker processes. Workers
+write observations, rewards and done flags straight into shared memory, so
+a step only sends a short command down each pipe. The simulation is never
+tied to the frame clock, so throughput grows with the number of cores.
+
+Requires NumPy. Throughput is measured by benchmarks/vector_env.py.
+"""
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+import pygame
+
+ACTIONS = ('idle', 'left', 'right', 'fire')
+OBSERVATIONS = ('state', 'frame')
+
+
+class AlienKittyEnv:
+    """A single game wrapped as a reset/step environment"""
+
+    def __init__(self, observation='state', overrides=None, seed=None):
+        """Build a headless game; overrides are passed on to AlienKitty"""
+        from alien_kitty import AlienKitty
+
+        if observation not in OBSERVATIONS:
+            raise ValueError(f"observation must be one of {OBSERVATIONS}, not {observation!r}")
+        self.observation = observation
+        self.game = AlienKitty(headless=True, overrides={**(overrides or {}), 'seed': seed})
+        self.settings = self.game.settings
+        self.action_count = len(ACTIONS)
+
+        if observation == 'state':
+            self.observation_shape = (6 + 4 * self.settings.env_observed_minions
+                                      + 3 * self.settings.env_observed_projectiles,)
+            self.observation_dtype = np.float32
+        else:
+            width, height = self.settings.env_frame_size
+            self.observation_shape = (height, width, 3)
+            self.observation_dtype = np.uint8
+            self._frame = pygame.Surface(self.settings.env_frame_size, 0, self.game.screen)
+
+        self.steps = 0
+        self._octo_health = self._total_octo_health()
+        self._kitty_health = self.game.kitty.health
+
+    def reset(self, seed=None):
+        """Start a new episode; returns (observation, info)"""
+        game = self.game
+        if seed is not None:
+            game.seed = seed
+            game.rng.seed(seed)  # Before the restart, so the new octos draw from it
+        game._restart_game()
+        game.kitty.center_kitty()
+        self.steps = 0
+        self._octo_health = self._total_octo_health()
+        self._kitty_health = game.kitty.health
+        return self.observe(), {}
+
+    def step(self, action):
+        """Apply action for env_frame_skip simulation steps
+
+        Returns (observation, reward, terminated, truncated, info); terminated
+        means the game is over, truncated that env_max_episode_steps ran out.
+        """
+        game = self.game
+        name = ACTIONS[action]
+        game.kitty.moving_left = name == 'left'
+        game.kitty.moving_right = name == 'right'
+        if name == 'fire':
+            game._fire_bullet()  # Ignored while bullets_allowed are already in flight
+
+        for _ in range(self.settings.env_frame_skip):
+            if game.game_over:
+                break
+            game._store_previous_positions()
+            game._update_game()
+        self.steps += 1
+
+        # Octos that die drop out of the group with zero health, so the totals still add up
+        octo_health = self._total_octo_health()
+        kitty_health = max(game.kitty.health, 0)
+        reward = (self.settings.env_reward_octo_hit * (self._octo_health - octo_health)
+                  + self.settings.env_reward_kitty_hit * (self._kitty_health - kitty_health))
+        self._octo_health = octo_health
+        self._kitty_health = kitty_health
+
+        terminated = game.game_over
+        truncated = not terminated and self.steps >= self.settings.env_max_episode_steps
+        info = {'game_over_reason': game.game_over_reason} if terminated else {}
+        return self.observe(), reward, terminated, truncated, info
+
+    def observe(self, out=None):
+        """Return the current observation, written into out if given"""
+        if out is None:
+            out = np.empty(self.observation_shape, self.observation_dtype)
+        if self.observation == 'state':
+            self._observe_state(out)
+        else:
+            self._observe_frame(out)
+        return out
+
+    def _total_octo_health(self):
+        return sum(octo.health for octo in self.game.octo)
+
+    def _observe_state(self, out):
+        """Positions scaled to 0..1 of the screen, health to 0..1 of its maximum"""
+        game, settings = self.game, self.settings
+        width, height = settings.screen_width, settings.screen_height
+        out[:] = 0.0
+
+        kitty = game.kitty
+        out[0] = kitty.rect.centerx / width
+        out[1] = max(kitty.health, 0) / settings.max_kitty_health
+        boss = game.boss_octo
+        if boss.alive():
+            out[2:6] = (boss.rect.centerx / width, boss.rect.centery / height,
+                        boss.health / boss.max_health, 1.0)
+
+        i = 6
+        minions = game.minions.sprites()[:settings.env_observed_minions]
+        for minion in minions:
+            out[i:i + 4] = (minion.rect.centerx / width, minion.rect.centery / height,
+                            minion.health / minion.max_health, 1.0)
+            i += 4
+        i = 6 + 4 * settings.env_observed_minions
+
+        # Nearest projectiles as offsets from the kitty, closest first
+        centers = self._projectile_centers()
+        if len(centers):
+            offsets = (centers - kitty.rect.center) / (width, height)
+            count = min(len(offsets), settings.env_observed_projectiles)
+            nearest = np.argsort(np.hypot(offsets[:, 0], offsets[:, 1]), kind='stable')[:count]
+            block = out[i:i + 3 * count].reshape(count, 3)
+            block[:, :2] = offsets[nearest]
+            block[:, 2] = 1.0
+
+    def _projectile_centers(self):
+        """(n, 2) array of projectile centres from whichever engine is running"""
+        array = self.game.projectile_array
+        if array is not None:
+            n, half = array.count, array.size / 2
+            return np.column_stack((array.x[:n] + half, array.y[:n] + half))
+        return np.array([p.rect.center for p in self.game.projectiles], dtype=np.float64).reshape(-1, 2)
+
+    def _observe_frame(self, out):
+        """Draw the frame off-screen and shrink it to env_frame_size"""
+        game = self.game
+        game.background.draw()
+        game._draw_game_elements()  # Not presented; the dummy display is never shown
+        pygame.transform.smoothscale(game.screen, self.settings.env_frame_size, self._frame)
+        out[:] = pygame.surfarray.pixels3d(self._frame).transpose(1, 0, 2)
+
+    def close(self):
+        pygame.quit()
+
+
+def _worker(conn, indices, observation, overrides, seed):
+    """Worker process: own a few environments and step them on command"""
+    envs = [AlienKittyEnv(observation, overrides, None if seed is None else seed + i) for i in indices]
+    conn.send((envs[0].observation_shape, np.dtype(envs[0].observation_dtype).str, envs[0].settings.env_frame_skip))
+
+    # Attach to the buffers the parent allocated once it knew the observation shape
+    names, num_envs, shape, dtype = conn.recv()
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    obs, actions, rewards, terminated, truncated = _views(blocks, num_envs, shape, dtype)
+
+    try:
+        while True:
+            command, payload = conn.recv()
+            if command == 'reset':
+                for i, env in zip(indices, envs):
+                    env_seed = None if payload is None else payload + i
+                    env.reset(env_seed)
+                    env.observe(obs[i])
+                conn.send(None)
+            elif command == 'step':
+                infos = {}
+                for i, env in zip(indices, envs):
+                    _, rewards[i], terminated[i], truncated[i], info = env.step(actions[i])
+                    if terminated[i] or truncated[i]:
+                        # Start the next episode right away; the caller sees its first observation
+                        info['final_state'] = env.game.get_state()
+                        env.reset()
+                        infos[i] = info
+                    env.observe(obs[i])
+                conn.send(infos)
+            elif command == 'close':
+                break
+    finally:
+        del obs, actions, rewards, terminated, truncated
+        for block in blocks:
+            block.close()
+        conn.close()
+
+
+def _views(blocks, num_envs, shape, dtype):
+    """NumPy views over the shared buffers: obs, actions, rewards, terminated, truncated"""
+    specs = [((num_envs, *shape), dtype), (num_envs, np.int64), (num_envs, np.float64),
+             (num_envs, np.bool_), (num_envs, np.bool_)]
+    return [np.ndarray(shape, dtype, buffer=block.buf) for block, (shape, dtype) in zip(blocks, specs)]
+
+
+class VectorEnv:
+    """N environments stepped in parallel by a pool of worker processes
+
+    Observations come back as one (num_envs, ...) array in shared memory. It
+    is overwritten by the next step, so copy it if you need to keep it. An
+    environment whose episode ends is reset straight away; its info carries
+    the final game state.
+    """
+
+    def __init__(self, num_envs, observation='state', overrides=None, processes=None, seed=None):
+        """Start the workers; processes defaults to one per core, at most one per env"""
+        self.num_envs = num_envs
+        processes = min(processes or multiprocessing.cpu_count(), num_envs)
+        # Spawn rather than fork: SDL state must not be shared between processes
+        context = multiprocessing.get_context('spawn')
+
+        self._pipes = []
+        self._processes = []
+        for worker in range(processes):
+            indices = list(range(worker, num_envs, processes))
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_worker, args=(child_conn, indices, observation, overrides, seed),
+                                      daemon=True)
+            process.start()
+            child_conn.close()
+            self._pipes.append(parent_conn)
+            self._processes.append(process)
+
+        shape, dtype, self.frame_skip = [conn.recv() for conn in self._pipes][0]
+        self.observation_shape, self.observation_dtype = shape, np.dtype(dtype)
+        sizes = [num_envs * int(np.prod(shape)) * self.observation_dtype.itemsize,
+                 num_envs * 8, num_envs * 8, num_envs, num_envs]
+        self._blocks = [shared_memory.SharedMemory(create=True, size=size) for size in sizes]
+        self.observations, self._actions, self.rewards, self.terminated, self.truncated = _views(
+            self._blocks, num_envs, shape, self.observation_dtype)
+        for conn in self._pipes:
+            conn.send(([block.name for block in self._blocks], num_envs, shape, self.observation_dtype))
+        self.closed = False
+
+    def reset(self, seed=None):
+        """Reset every environment; returns (observations, infos)"""
+        for conn in self._pipes:
+            conn.send(('reset', seed))
+        for conn in self._pipes:
+            conn.recv()
+        return self.observations, [{} for _ in range(self.num_envs)]
+
+    def step(self, actions):
+        """Step every environment with its action
+
+        Returns (observations, rewards, terminated, truncated, infos), all arrays
+        in shared memory except infos, a list of dicts.
+        """
+        self._actions[:] = actions
+        for conn in self._pipes:
+            conn.send(('step', None))
+        infos = [{} for _ in range(self.num_envs)]
+        for conn in self._pipes:
+            for i, info in conn.recv().items():
+                infos[i] = info
+        return self.observations, self.rewards, self.terminated, self.truncated, infos
+
+    def close(self):
+        """Stop the workers and free the shared memory"""
+        if self.closed:
+            return
+        for conn in self._pipes:
+            conn.send(('close', None))
+        for process in self._processes:
+            process.join()
+        self.observations = self._actions = self.rewards = self.terminated = self.truncated = None
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,29 @@
+class HitFlash:
+    """A small animation state that drives an octo's hit flash
+
+    The flash alternates between the tinted and the normal frame every
+    simulation step for `duration` steps. It only tracks state; the sprite
+    swaps between its precomputed images.
+    """
+
+    def __init__(self, duration):
+        """Initialize an idle flash lasting duration steps"""
+        self.duration = duration
+        self.active = False
+        self.counter = 0
+
+    def start(self):
+        """Start (or restart) the flash"""
+        self.active = True
+        self.counter = 0
+
+    def advance(self):
+        """Step the flash; returns True while the tinted frame should show"""
+        if not self.active:
+            return False
+        self.counter += 1
+        if self.counter >= self.duration:
+            self.active = False
+            self.counter = 0
+            return False
+        return self.counter % 2 == 0
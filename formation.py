@@ -0,0 +1,174 @@
+import math
+from octo import Octo
+
+
+def orbit_heading(angle):
+    """Rotation that points the top of a minion along its orbit
+
+    angle grows clockwise on screen, so the minion travels 90 degrees
+    ahead of its angle; pygame rotates counterclockwise.
+    """
+    return (180 - angle) % 360
+
+
+class Formation:
+    """A class to move the minions orbiting one boss
+
+    Each minion has an orbit angle and a radius, stored by index next to the
+    list of minion sprites. The radius is a fraction of the boss's fixed
+    radius (its distance to the nearest screen edge, computed once per boss
+    per step). Rings, spirals and several rings can share one formation.
+    This version uses plain lists and math; ArrayFormation moves every
+    minion in one NumPy pass.
+    """
+
+    def __init__(self, ak_game, boss):
+        """Initialize an empty formation around boss"""
+        self.game = ak_game
+        self.settings = ak_game.settings
+        self.boss = boss
+        self.minions = []  # Index i of every array below belongs to minions[i]
+        self._allocate()
+
+    def __len__(self):
+        return len(self.minions)
+
+    def add_ring(self, count, radius=1.0, phase=0.0):
+        """Add count minions evenly spaced on one ring, starting phase degrees in"""
+        step = 360 / count if count > 0 else 0
+        self.add([phase + i * step for i in range(count)], [radius] * count)
+
+    def add_rings(self, counts, inner=0.5, outer=1.0):
+        """Add one ring per entry of counts, spaced evenly from inner to outer radius"""
+        for i, count in enumerate(counts):
+            radius = inner + (outer - inner) * i / (len(counts) - 1) if len(counts) > 1 else outer
+            self.add_ring(count, radius, phase=i * 180 / max(count, 1))  # Stagger neighbouring rings
+
+    def add_spiral(self, count, turns=1.0, inner=0.4, outer=1.0):
+        """Add count minions on a spiral winding turns times from inner to outer radius"""
+        span = max(count - 1, 1)
+        self.add([i * 360 * turns / span for i in range(count)],
+                 [inner + (outer - inner) * i / span for i in range(count)])
+
+    def add(self, angles, radii):
+        """Create a minion for every (angle, radius) pair and place it straight away"""
+        cx, cy = self.boss.rect.center
+        fixed_radius = self._fixed_radius()
+        for angle, radius in zip(angles, radii):
+            rad_angle = math.radians(angle)
+            x = cx + radius * fixed_radius * math.cos(rad_angle)
+            y = cy + radius * fixed_radius * math.sin(rad_angle)
+            minion = Octo(self.game, 'images/AlienOctoSmall.png', x, y, octo_type='small')
+            self.adopt(minion, angle % 360, radius)
+            self.game.octo.add(minion)
+            self.game.minions.add(minion)
+
+    def adopt(self, minion, angle, radius):
+        """Make an existing minion orbit in this formation at angle and radius"""
+        minion.formation = self
+        minion.formation_index = len(self.minions)
+        minion.angle = angle
+        minion.heading = orbit_heading(angle)
+        self.minions.append(minion)
+        self._append(angle, radius)
+
+    def remove(self, minion):
+        """Drop a minion by moving the last one into its slot"""
+        i = minion.formation_index
+        last = len(self.minions) - 1
+        if i != last:
+            moved = self.minions[last]
+            self.minions[i] = moved
+            moved.formation_index = i
+            self._move(last, i)
+        self.minions.pop()
+        self._pop()
+
+    def update(self, dt):
+        """Advance every minion along its orbit around the boss"""
+        if not self.minions or not self.boss.alive():
+            return  # Orphaned minions hold their position
+        cx, cy = self.boss.rect.center
+        step = self.settings.minion_orbit_speed * dt
+        centers = self._advance(step, cx, cy, self._fixed_radius())
+        for minion, center, angle, heading in zip(self.minions, *centers):
+            minion.angle = angle
+            minion.heading = heading
+            minion.rect.center = center
+
+    def _fixed_radius(self):
+        cx, cy = self.boss.rect.center
+        size = self.settings.small_alien_size[0]
+        return self.game._calculate_fixed_radius(cx, cy, size, size)
+
+    # Storage; ArrayFormation replaces these with NumPy arrays
+
+    def _allocate(self):
+        self.angles = []
+        self.radii = []
+
+    def _append(self, angle, radius):
+        self.angles.append(angle)
+        self.radii.append(radius)
+
+    def _move(self, source, target):
+        self.angles[target] = self.angles[source]
+        self.radii[target] = self.radii[source]
+
+    def _pop(self):
+        self.angles.pop()
+        self.radii.pop()
+
+    def _advance(self, step, cx, cy, fixed_radius):
+        """Turn every angle by step degrees; return the new centres, angles and headings"""
+        angles = self.angles
+        centers, headings = [], []
+        cos, sin, radians = math.cos, math.sin, math.radians
+        for i, radius in enumerate(self.radii):
+            angle = angles[i] = (angles[i] + step) % 360
+            rad_angle = radians(angle)
+            centers.append((cx + radius * fixed_radius * cos(rad_angle), cy + radius * fixed_radius * sin(rad_angle)))
+            headings.append((180 - angle) % 360)  # orbit_heading, inlined
+        return centers, angles, headings
+
+
+class ArrayFormation(Formation):
+    """Formation whose angles and radii live in NumPy arrays, moved in one vectorized pass"""
+
+    def _allocate(self):
+        import numpy as np
+        self._np = np
+        self.count = 0
+        self.angles = np.zeros(16, dtype=np.float64)
+        self.radii = np.zeros(16, dtype=np.float64)
+
+    def _append(self, angle, radius):
+        if self.count == len(self.angles):
+            # Double the capacity, keeping the live entries
+            self.angles = self._np.concatenate((self.angles, self._np.zeros_like(self.angles)))
+            self.radii = self._np.concatenate((self.radii, self._np.zeros_like(self.radii)))
+        self.angles[self.count] = angle
+        self.radii[self.count] = radius
+        self.count += 1
+
+    def _move(self, source, target):
+        self.angles[target] = self.angles[source]
+        self.radii[target] = self.radii[source]
+
+    def _pop(self):
+        self.count -= 1
+
+    def _advance(self, step, cx, cy, fixed_radius):
+        np = self._np
+        n = self.count
+        angles = self.angles[:n]
+        angles += step
+        np.mod(angles, 360, out=angles)
+        rad_angles = np.radians(angles)
+        distances = self.radii[:n] * fixed_radius
+        centers = np.empty((n, 2))
+        np.multiply(distances, np.cos(rad_angles), out=centers[:, 0])
+        np.multiply(distances, np.sin(rad_angles), out=centers[:, 1])
+        centers += (cx, cy)
+        headings = np.mod(180 - angles, 360)
+        return centers.tolist(), angles.tolist(), headings.tolist()
@@ -0,0 +1,90 @@
+import pygame
+
+class HealthBar:
+    """A bar style: its size and colours, and one pre-rendered surface per fill width
+
+    Health only changes on a hit, so each width is drawn once and every bar
+    of this style blits the shared surface after that.
+    """
+
+    def __init__(self, size, background_color, fill_color):
+        """Initialize the style; nothing is rendered until a width is first needed"""
+        self.size = size
+        self.background_color = background_color
+        self.fill_color = fill_color
+        self._surfaces = {}  # Fill width in pixels -> finished bar
+        self.renders = 0
+
+    def surface(self, health, max_health):
+        """The bar for health out of max_health"""
+        length, height = self.size
+        fill = int(min(max(health, 0) / max_health, 1.0) * length)
+        surface = self._surfaces.get(fill)
+        if surface is None:
+            surface = pygame.Surface(self.size).convert()
+            surface.fill(self.background_color)
+            surface.fill(self.fill_color, (0, 0, fill, height))
+            self._surfaces[fill] = surface
+            self.renders += 1
+        return surface
+
+
+class Hud:
+    """A class to draw the kitty, boss and minion health bars
+
+    Bars are blitted from HealthBar's cached surfaces, minion bars all in one
+    Surface.blits call. Above minion_health_bar_limit minions, or when the
+    frame pacer sheds them, their bars are skipped altogether.
+    """
+
+    def __init__(self, ak_game):
+        """Initialize the bar styles and positions"""
+        self.game = ak_game
+        self.settings = ak_game.settings
+        self.screen = ak_game.screen
+
+        settings = self.settings
+        self.kitty_bar = HealthBar((settings.kitty_health_bar_length, settings.kitty_health_bar_height),
+                                   (255, 255, 0), (144, 244, 153))  # Yellow behind green
+        self.boss_bar = HealthBar((settings.boss_health_bar_length, settings.boss_health_bar_height),
+                                  (255, 0, 0), (0, 255, 0))  # Red for lost health, green for the rest
+        self.minion_bar = HealthBar((settings.minion_health_bar_length, settings.minion_health_bar_height),
+                                    (255, 0, 0), (0, 255, 0))
+
+        scale = settings.render_scale
+        self.kitty_position = (settings.screen_width - round(220 * scale), settings.screen_height - round(80 * scale))
+        # Boss bars sit at the centre top of the screen, stacked when there are several
+        self.boss_position = ((settings.screen_width - settings.boss_health_bar_length) // 2, round(50 * scale))
+        self.gap = max(1, round(5 * scale))  # Between stacked bars, and between a minion and its bar
+        self.minion_bars_enabled = True  # Switched off by the frame pacer's quality tiers
+        self.minion_bars_shown = True
+
+    def draw(self):
+        """Draw every health bar and return the areas drawn"""
+        screen = self.screen
+        kitty = self.game.kitty
+        drawn = [screen.blit(self.kitty_bar.surface(kitty.health, kitty.starting_health), self.kitty_position)]
+
+        x, y = self.boss_position
+        for boss in self.game.bosses:
+            drawn.append(screen.blit(self.boss_bar.surface(boss.health, boss.max_health), (x, y)))
+            y += self.boss_bar.size[1] + self.gap
+
+        minions = self.game.minions
+        limit = self.settings.minion_health_bar_limit
+        self.minion_bars_shown = self.minion_bars_enabled and (limit is None or len(minions) <= limit)
+        if self.minion_bars_shown and minions:
+            drawn.extend(screen.blits(self._minion_bars(minions)))
+        return drawn
+
+    def _minion_bars(self, minions):
+        """(surface, position) for the bar just above every minion"""
+        bar = self.minion_bar
+        length, height = bar.size
+        half_length = length // 2
+        offset = height + self.gap
+        return [
+            (bar.surface(minion.health, minion.max_health),
+             (minion.rect.centerx - half_length, minion.rect.centery - minion.half_height - offset))
+            for minion in minions
+        ]
@@ -1,5 +1,3 @@
-import pygame
- 
 class Kitty:
     """A class to manage the kitty"""
  
@@ -10,8 +8,9 @@ class Kitty:
         self.settings = ak_game.settings
 
         # Load the ship image and get its rectangle
-        self.image = pygame.image.load('images/AlienKitty.png').convert_alpha()
+        self.image = ak_game.assets.image('images/AlienKitty.png', self.settings.kitty_size)
         self.rect = self.image.get_rect()
+        self.mask = ak_game.assets.mask(self.image)
 
         # Start each new kitty at the bottom center of the screen
         self.rect.midbottom = (self.screen_rect.centerx, self.screen_rect.bottom - self.settings.margin)
@@ -24,39 +23,34 @@ class Kitty:
         self.moving_left = False
 
         self.starting_health = self.settings.max_kitty_health
-        self.sound = self.settings.kitty_sound
+        self.assets = ak_game.assets
 
         self.health = self.starting_health  # Health starts at full
 
     def blitme(self):
-        """Draw the kitty at its current location"""
-        self.screen.blit(self.image, self.rect)
+        """Draw the kitty at its current location and return the area drawn"""
+        return self.screen.blit(self.image, self.rect)
 
-    def update(self):
-        """Update kitty's position based on movement flags"""
+    def update(self, dt):
+        """Update kitty's position based on movement flags; dt is the step length in seconds"""
         if self.moving_right and self.rect.right < self.screen_rect.right - self.settings.margin:
-            self.x += self.settings.kitty_speed
+            self.x += self.settings.kitty_speed * dt
         if self.moving_left and self.rect.left > self.settings.margin:
-            self.x -= self.settings.kitty_speed
+            self.x -= self.settings.kitty_speed * dt
 
         self.rect.x = self.x
 
-    def draw_health_bar(self):
-        """Draw health bar on the screen."""
-        if self.health < 0:
-            self.health = 0
-        bar_length = 150  # 100 pixels
-        bar_height = 20
-        fill = (self.health / 3) * bar_length
-        health_bar_background = pygame.Rect(self.settings.screen_width - 220, self.settings.screen_height - 80, bar_length, bar_height)
-        health_bar_fill = pygame.Rect(self.settings.screen_width - 220, self.settings.screen_height - 80, fill, bar_height)
-
-        pygame.draw.rect(self.screen, (255, 255, 0), health_bar_background)  # Yellow
-        pygame.draw.rect(self.screen, (144, 244, 153), health_bar_fill)  # Green 
-
     def hit_sound(self):
         """Play when kitty is hit"""
-        self.sound.play()
+        if self.settings.sound_enabled:
+            self.assets.sound(self.settings.kitty_sound_path).play()
+
+    def center_kitty(self):
+        """Put the kitty back at the bottom center and stop it"""
+        self.rect.midbottom = (self.screen_rect.centerx, self.screen_rect.bottom - self.settings.margin)
+        self.x = float(self.rect.x)
+        self.moving_right = False
+        self.moving_left = False
 
     def reset_health(self):
         """Reset kitty health when game restarts"""
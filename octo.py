@@ -1,7 +1,5 @@
-import pygame
-import random
 from pygame.sprite import Sprite
-from projectiles import Projectile
+from flash import HitFlash
 
 class Octo(Sprite):
     """A class to manage octos"""
@@ -12,102 +10,115 @@ class Octo(Sprite):
         self.settings = ak_game.settings
         self.screen = ak_game.screen
         self.projectiles = ak_game.projectiles
-        self.sound = self.settings.blast_sound
         self.octo_type = octo_type
-        self.image = pygame.image.load(image_path).convert_alpha()
-
+        self.image_path = image_path
         if self.octo_type == 'boss':
-            self.image = pygame.transform.scale(self.image, (self.settings.boss_alien_size))  # Example: Scale up for boss
-            self.original_image = self.image.copy()  # Store original image for reset
+            size = self.settings.boss_alien_size
             self.max_health = self.settings.max_boss_health
-            self.velocity = 1
+            self.velocity = self.settings.boss_speed
         else:
-            self.image = pygame.transform.scale(self.image, (self.settings.small_alien_size))  # Example: Scale down for minions
-            self.original_image = self.image.copy()  # Store original image for reset
+            size = self.settings.small_alien_size
             self.max_health = self.settings.max_minion_health
             self.velocity = 0
 
+        # Normal and hit-flash frames are shared by every octo of the same type and never drawn on
+        self.original_image = ak_game.assets.image(image_path, size)
+        self.flash_image = ak_game.assets.tinted(image_path, size, self.settings.hit_flash_color)
+        self.image = self.original_image
+        self.mask = ak_game.assets.mask(self.original_image)  # The flash frame has the same shape, so it shares this
+
         self.rect = self.image.get_rect(center=(x, y))
+        self.x = float(self.rect.x)
         self.health = self.max_health
+        self.half_height = size[1] // 2  # Unrotated, so the health bar doesn't bob as the octo turns
+
+        # Minions belong to their boss's formation, which moves them
+        self.formation = None
+        self.formation_index = None
+
+        # Minions turn to face their travel using pre-rotated frames shared by every minion
+        self.rotations = None
+        self.heading = 0.0  # Degrees counterclockwise from the image's own orientation
+        if self.octo_type == 'small' and self.settings.minion_rotation_steps:
+            self.rotations = ak_game.assets.rotations(image_path, size, self.settings.minion_rotation_steps,
+                                                      self.settings.hit_flash_color)
 
-        # Random Shooting settings
-        self.shoot_delay = random.randint(5000, 10000)  # Initial delay between 5-10 seconds
-        self.last_shot_time = pygame.time.get_ticks() - random.randint(0, self.shoot_delay)  # Stagger start times
+        # Random Shooting settings, timed in simulation seconds
+        self.roll_shot_timer()
 
         # Flash Settings
-        self.hit_flash_duration = 10
-        self.is_flashing = False
-        self.flash_counter = 0
+        self.flash = HitFlash(self.settings.hit_flash_duration)
 
-    def update(self):
-        """Update the octo's behaviour"""
+    def roll_shot_timer(self):
+        """Pick a fresh random shot delay, with the first shot staggered into it"""
+        self.shoot_delay = self.game.rng.uniform(*self.settings.octo_shoot_delay)  # Initial delay between 5-10 seconds
+        self.last_shot_time = self.game.sim_time - self.game.rng.uniform(0, self.shoot_delay)  # Stagger start times
+
+    def update(self, dt):
+        """Update the octo's behaviour; dt is the step length in seconds"""
         # Moving logic
         if self.octo_type == 'boss':
-            self.rect.x += self.velocity
+            self.x += self.velocity * dt
+            self.rect.x = self.x
             if self.rect.right >= self.settings.screen_width or self.rect.left <= 0:
                 self.velocity *= -1  # Change direction
 
         # Shooting logic
-        current_time = pygame.time.get_ticks()
+        current_time = self.game.sim_time
         if current_time - self.last_shot_time > self.shoot_delay:
             self.shoot()
             self.last_shot_time = current_time
-            self.shoot_delay = random.randint(5000, 10000)  # Reset delay for randomness
-
-        if self.is_flashing:
-            self.flash_counter += 1
-            if self.flash_counter % 2 == 0:
-                self.image.fill((255, 0, 0, 128), special_flags=pygame.BLEND_RGBA_MULT)  # Tint red
-            else:
-                self.image = self.original_image.copy()  # Reset to original image
-            if self.flash_counter >= self.hit_flash_duration:
-                self.is_flashing = False
-                self.flash_counter = 0
-                self.image = self.original_image.copy()  # Ensure image is reset after flashing
+            self.shoot_delay = self.game.rng.uniform(*self.settings.octo_shoot_delay)  # Reset delay for randomness
+
+        # Flashing and turning only swap between precomputed frames
+        flashing = self.flash.advance() and self.game.flash_effects
+        if self.rotations is None:
+            self.image = self.flash_image if flashing else self.original_image
+        else:
+            self._face_heading(flashing)
+
+    def _face_heading(self, flashing):
+        """Swap in the pre-rotated frame, bounding rect and mask nearest to heading"""
+        rotations = self.rotations
+        i = rotations.index(self.heading)
+        self.image = rotations.flash_images[i] if flashing else rotations.images[i]
+        self.mask = rotations.masks[i]
+        center = self.rect.center
+        self.rect = rotations.rects[i].copy()
+        self.rect.center = center
 
     def shoot(self):
         """Create a projectile moving downwards."""
         if self.octo_type == 'boss' or self.octo_type == 'small':
             # Assume projectile moves downwards with direction = 1
-            new_projectile = Projectile(self.game, self.rect.centerx, self.rect.bottom)
+            if self.game.projectile_array is not None:
+                self.game.projectile_array.spawn(self.rect.centerx, self.rect.bottom)
+                return
+            new_projectile = self.game.projectile_pool.acquire()  # Recycled when possible
+            new_projectile.reset(self.rect.centerx, self.rect.bottom)
             self.game.projectiles.add(new_projectile)
-
-    def draw_health_bar(self):
-        """Claculations for octo health"""
-        self.health_bar_length = self.settings.boss_health_bar_length if self.octo_type == 'boss' else self.settings.minion_health_bar_length  # Length of the health bar in pixels
-        self.health_bar_height = self.settings.boss_health_bar_height if self.octo_type == 'boss' else self.settings.minion_health_bar_height # Height of the health bar in pixels
-        # Calculate position for the health bar
-        if self.octo_type == 'boss':
-            # Position it at the center top of the screen
-            bar_x = (self.settings.screen_width - self.health_bar_length) // 2
-            bar_y = 50  # 20 pixels from the top of the screen
-        else:
-            # Position it just above the octo for minions
-            bar_x = self.rect.x
-            bar_y = self.rect.y - self.health_bar_height - 5
-
-        # Draw the background of the health bar
-        health_bar_background = pygame.Rect(bar_x, bar_y, self.health_bar_length, self.health_bar_height)
-        pygame.draw.rect(self.screen, (255, 0, 0), health_bar_background)  # Red background for lost health
-
-        # Calculate current health bar length
-        current_health_length = (self.health / self.max_health) * self.health_bar_length
-
-        # Draw foreground of health bar
-        health_bar_foreground = pygame.Rect(bar_x, bar_y, current_health_length, self.health_bar_height)
-        pygame.draw.rect(self.screen, (0, 255, 0), health_bar_foreground)  # Green foreground for current health
+            if self.settings.collision_broadphase:
+                self.game.projectile_grid.insert(new_projectile)
 
     def draw(self):
-        """Draw the octo on the screen."""
-        self.screen.blit(self.image, self.rect)
-        self.draw_health_bar()  # Draw health bar when drawing the Octo
+        """Draw the octo on the screen and return the area drawn; its health bar is drawn by the Hud"""
+        return self.screen.blit(self.image, self.rect)
+
+    def kill(self):
+        """Remove the octo from its groups and its formation"""
+        if self.formation is not None:
+            self.formation.remove(self)
+            self.formation = None
+        if self.alive():
+            self.game.fallen_octos.append(self)  # Reused by the next restore instead of building a new octo
+        super().kill()
 
     def hit(self):
         """Flash when octo is hit"""
         self.health -= 1
-        self.is_flashing = True
-        self.flash_counter = 0
+        self.flash.start()
 
     def hit_sound(self):
         """Play when boss octo is defeated"""
-        self.sound.play()
\ No newline at end of file
+        if self.settings.sound_enabled:
+            self.game.assets.sound(self.settings.blast_sound_path).play()
\ No newline at end of file
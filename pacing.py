@@ -0,0 +1,142 @@
+import time
+from collections import deque
+
+# What each quality tier switches off, in the order load is shed
+QUALITY_TIERS = ('full', 'no stars', 'no minion bars', 'no hit flash')
+
+
+class FramePacer:
+    """A class to pace the interactive loop and shed load when frames run long
+
+    The simulation always runs. Each frame is due 1 / render_fps seconds after
+    the last one started; one that starts more than a whole frame after that
+    is behind, so its render is skipped (at most max_render_skip in a row,
+    counted as dropped) and the loop goes straight round again instead of
+    sleeping. The step count can't tell this: at 30 fps every frame takes two
+    60 Hz steps. When the smoothed cost of updating plus rendering stays over
+    the 1 / render_fps budget, quality drops a tier; it comes back once the
+    cost stays well under.
+    """
+
+    def __init__(self, ak_game):
+        """Initialize the cost estimates and metrics; timing starts with the first frame"""
+        self.game = ak_game
+        self.settings = ak_game.settings
+        self.budget = 1 / self.settings.render_fps
+        self.mode = self.settings.pacing_mode
+
+        self.update_cost = 0.0  # Smoothed seconds spent simulating per frame
+        self.render_cost = 0.0  # Smoothed seconds per render
+        self._frame_start = 0.0
+        self._update_end = 0.0
+        self._due = None        # When the current frame was due to start
+        self._late = 0.0        # How far past that it did start
+        self._skipped_in_a_row = 0
+        self._dropped = False   # Whether the current frame was skipped
+
+        self.quality = 0
+        self._over_budget = 0   # Consecutive frames above / below the tier thresholds
+        self._under_budget = 0
+
+        # Metrics
+        self.presented_frames = 0
+        self.dropped_frames = 0
+        self._input_time = None  # When the oldest not-yet-presented input was read
+        self.latencies = deque(maxlen=self.settings.pacing_latency_window)
+
+    def begin_frame(self):
+        """Call before reading input"""
+        self._frame_start = time.perf_counter()
+        self._dropped = False
+        if self._due is None:
+            self._due = self._frame_start
+        self._late = self._frame_start - self._due
+        self._due = self._frame_start + self.budget  # From when this one started, so clock jitter doesn't add up
+
+    def resync(self):
+        """Start the schedule afresh, e.g. after time spent in a menu"""
+        self._due = None
+        self._input_time = None  # Or the menu time would count as input latency
+
+    def input_received(self):
+        """Note that this frame read gameplay input"""
+        if self._input_time is None:
+            self._input_time = self._frame_start
+
+    def end_update(self):
+        """Call once the simulation steps for the frame are done"""
+        self._update_end = time.perf_counter()
+        self.update_cost = self._smooth(self.update_cost, self._update_end - self._frame_start)
+
+    def should_render(self):
+        """Whether to draw this frame; False drops it to get back on schedule"""
+        behind = self._late > self.budget
+        if not (self.settings.render_skip and behind) or self._skipped_in_a_row >= self.settings.max_render_skip:
+            self._skipped_in_a_row = 0
+            return True
+        self._skipped_in_a_row += 1
+        self.dropped_frames += 1
+        self._dropped = True
+        return False
+
+    def end_render(self):
+        """Call once the frame is presented"""
+        now = time.perf_counter()
+        self.render_cost = self._smooth(self.render_cost, now - self._update_end)
+        self.presented_frames += 1
+        if self._input_time is not None:
+            self.latencies.append(now - self._input_time)
+            self._input_time = None
+
+    def end_frame(self, clock):
+        """Adjust the quality tier, then wait for the next frame"""
+        if self.settings.quality_tiers:
+            self._adjust_quality()
+        if self._dropped:
+            clock.tick()  # Go straight round; the next frame is already late
+        elif self.mode == 'busy':
+            clock.tick_busy_loop(self.settings.render_fps)  # Spins instead of sleeping, for tighter frame times
+        elif self.mode == 'vsync':
+            clock.tick()  # The flip already waited for the display
+        else:
+            clock.tick(self.settings.render_fps)
+
+    def _smooth(self, average, sample):
+        """Exponential moving average, seeded by the first sample"""
+        if average == 0.0:
+            return sample
+        return average + (sample - average) * self.settings.pacing_smoothing
+
+    def _adjust_quality(self):
+        """Drop or restore a tier once the frame cost has stayed out of range long enough"""
+        load = (self.update_cost + self.render_cost) / self.budget
+        self._over_budget = self._over_budget + 1 if load > self.settings.quality_degrade_load else 0
+        self._under_budget = self._under_budget + 1 if load < self.settings.quality_restore_load else 0
+        sustain = self.settings.quality_sustain_frames
+        if self._over_budget >= sustain and self.quality < len(QUALITY_TIERS) - 1:
+            self.set_quality(self.quality + 1)
+        elif self._under_budget >= 2 * sustain and self.quality > 0:  # Slower to restore, so tiers don't flap
+            self.set_quality(self.quality - 1)
+
+    def set_quality(self, tier):
+        """Switch the effects for tier on or off; rendering only, the simulation is unaffected"""
+        self.quality = tier
+        self._over_budget = self._under_budget = 0
+        self.game.background.show_stars = tier < 1
+        self.game.hud.minion_bars_enabled = tier < 2
+        self.game.flash_effects = tier < 3
+
+    def stats(self):
+        """Pacing metrics, times in milliseconds"""
+        latencies = sorted(self.latencies)
+        p50 = latencies[len(latencies) // 2] * 1000 if latencies else 0.0
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000 if latencies else 0.0
+        return {
+            'quality': QUALITY_TIERS[self.quality],
+            'presented_frames': self.presented_frames,
+            'dropped_frames': self.dropped_frames,
+            'update_ms': self.update_cost * 1000,
+            'render_ms': self.render_cost * 1000,
+            'input_latency_p50_ms': p50,
+            'input_latency_p95_ms': p95,
+        }
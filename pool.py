@@ -0,0 +1,49 @@
+class ObjectPool:
+    """A class to recycle short-lived game objects instead of reallocating them"""
+
+    def __init__(self, factory, capacity):
+        """Initialize an empty pool; factory() builds a new object when none are free"""
+        self.factory = factory
+        self.capacity = capacity  # Most free objects kept around for reuse
+        self._free = []
+
+        # Stats
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+        self.high_water_mark = 0  # Most objects ever in use at once
+
+    def prefill(self, count):
+        """Create objects up front so the first spawns don't allocate"""
+        while len(self._free) < min(count, self.capacity):
+            self._free.append(self.factory())
+            self.created += 1
+
+    def acquire(self):
+        """Return a free object, creating one if the pool is empty"""
+        if self._free:
+            obj = self._free.pop()
+            self.reused += 1
+        else:
+            obj = self.factory()
+            self.created += 1
+        self.in_use += 1
+        self.high_water_mark = max(self.high_water_mark, self.in_use)
+        return obj
+
+    def release(self, obj):
+        """Hand an object back; it is dropped if the pool is already full"""
+        self.in_use -= 1
+        if len(self._free) < self.capacity:
+            self._free.append(obj)
+
+    def stats(self):
+        """Return a snapshot of the pool counters"""
+        return {
+            'capacity': self.capacity,
+            'free': len(self._free),
+            'in_use': self.in_use,
+            'high_water_mark': self.high_water_mark,
+            'created': self.created,
+            'reused': self.reused,
+        }
@@ -0,0 +1,197 @@
+import atexit
+import json
+import queue
+import threading
+import time
+from collections import deque
+import pygame
+
+class FrameProfiler:
+    """A class to time each phase of the game loop
+
+    Timing works by wrapping the instrumented methods on the game objects,
+    so while the profiler is off nothing is wrapped and it costs nothing
+    beyond one flag check per frame. Per-frame records can be streamed to a
+    .csv or .jsonl file by a background thread.
+    """
+
+    def __init__(self, ak_game):
+        """Initialize the profiler; instrumentation is installed by enable()"""
+        self.game = ak_game
+        self.settings = ak_game.settings
+
+        self.enabled = False
+        self.hud_visible = False
+        self._wrapped = []          # (object, attribute name) pairs to restore on disable()
+        self._current = {}          # phase -> nanoseconds spent so far this frame
+        self._last_frame_end = None
+        self.frame_count = 0
+
+        window = self.settings.profiler_window
+        self.history = {name: deque(maxlen=window) for name in self.phase_names()}
+
+        self._hud_surface = None
+        self._hud_age = 0
+
+        self._queue = None
+        self._writer = None
+        self.dropped_records = 0
+
+    def _phases(self):
+        """(name, object, method name) for every instrumented phase"""
+        game = self.game
+        return [
+            ('events', game, '_check_events'),
+            ('update', game, '_update_game'),
+            ('update.kitty', game.kitty, 'update'),
+            ('update.bullets', game, '_update_bullets'),
+            ('update.bullets.collisions', game, '_check_bullet_octo_collisions'),
+            ('update.minions', game, '_update_minions'),
+            ('update.projectiles', game, '_update_projectiles'),
+            ('update.projectiles.collisions', game, '_check_projectile_kitty_collisions'),
+            ('render', game, '_render_objects'),
+            ('render.background', game.background, 'draw'),
+            ('render.background', game.background, 'restore'),
+            ('render.elements', game, '_draw_game_elements'),
+            ('render.elements.hud', game.hud, 'draw'),
+            ('render.present', game, '_present'),
+        ]
+
+    def phase_names(self):
+        """Every phase name, in order, plus the whole frame"""
+        names = ['frame']
+        for name, _, _ in self._phases():
+            if name not in names:
+                names.append(name)
+        return names
+
+    def enable(self):
+        """Wrap the instrumented methods and start the log writer, if configured"""
+        if self.enabled:
+            return
+        for name, obj, attribute in self._phases():
+            setattr(obj, attribute, self._timed(name, getattr(obj, attribute)))
+            self._wrapped.append((obj, attribute))
+        self._last_frame_end = time.perf_counter_ns()
+        self.enabled = True
+        if self.settings.profiler_log_path and self._writer is None:
+            self._start_writer(self.settings.profiler_log_path)
+
+    def disable(self):
+        """Remove the wrappers so the game runs uninstrumented again"""
+        for obj, attribute in self._wrapped:
+            delattr(obj, attribute)  # The class method shows through again
+        self._wrapped = []
+        self._current = {}
+        self.enabled = False
+
+    def toggle_hud(self):
+        """Show or hide the on-screen overlay, profiling while it is visible"""
+        self.hud_visible = not self.hud_visible
+        if self.hud_visible:
+            self.enable()
+        elif not self.settings.profiler_enabled:
+            self.disable()
+
+    def _timed(self, name, func):
+        """Return func wrapped so its run time is added to this frame's record"""
+        perf_counter_ns = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                current = self._current
+                current[name] = current.get(name, 0) + perf_counter_ns() - start
+        return timed
+
+    def end_frame(self):
+        """Close the current frame's record, add it to the history and queue it for the log"""
+        now = time.perf_counter_ns()
+        record = self._current
+        record['frame'] = now - self._last_frame_end
+        self._last_frame_end = now
+        self._current = {}
+        self.frame_count += 1
+
+        for name, samples in self.history.items():
+            samples.append(record.get(name, 0))
+
+        if self._queue is not None:
+            try:
+                self._queue.put_nowait((self.frame_count, record))
+            except queue.Full:
+                self.dropped_records += 1  # Never stall the game loop on logging
+
+    def percentiles(self, name, points=(50, 95, 99)):
+        """Rolling percentiles of a phase in milliseconds"""
+        samples = sorted(self.history[name])
+        if not samples:
+            return tuple(0.0 for _ in points)
+        last = len(samples) - 1
+        return tuple(samples[min(last, int(p / 100 * len(samples)))] / 1e6 for p in points)
+
+    def summary(self):
+        """{phase: (p50, p95, p99)} in milliseconds"""
+        return {name: self.percentiles(name) for name in self.history}
+
+    def draw_hud(self, screen):
+        """Draw the overlay and return the area drawn; it is re-rendered a few times a second"""
+        self._hud_age -= 1
+        if self._hud_surface is None or self._hud_age <= 0:
+            self._hud_surface = self._render_hud()
+            self._hud_age = self.settings.profiler_hud_refresh
+        position = (self.settings.margin + self.settings.outer_border_thickness + self.settings.inner_border_thickness,) * 2
+        return screen.blit(self._hud_surface, position)
+
+    def _render_hud(self):
+        """Render the percentile table into a translucent panel"""
+        font = self.game.assets.font(self.settings.profiler_hud_font_size)
+        lines = [f"{'phase':<30}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for name, (p50, p95, p99) in self.summary().items():
+            lines.append(f"{name:<30}{p50:>7.2f}{p95:>7.2f}{p99:>7.2f}")
+        pacing = self.game.pacer.stats()
+        lines.append(f"quality: {pacing['quality']}, dropped {pacing['dropped_frames']} "
+                     f"of {pacing['dropped_frames'] + pacing['presented_frames']} frames")
+        lines.append(f"input to present: {pacing['input_latency_p50_ms']:.1f} ms p50, "
+                     f"{pacing['input_latency_p95_ms']:.1f} ms p95")
+        texts = [font.render(line, True, (255, 255, 255)) for line in lines]
+        line_height = font.get_linesize()
+        panel = pygame.Surface((max(t.get_width() for t in texts) + 10, line_height * len(texts) + 10))
+        panel.set_alpha(200)
+        for i, text in enumerate(texts):
+            panel.blit(text, (5, 5 + i * line_height))
+        return panel
+
+    def _start_writer(self, path):
+        """Start the background thread that streams frame records to path"""
+        self._queue = queue.Queue(maxsize=self.settings.profiler_queue_size)
+        self._writer = threading.Thread(target=self._write_records, args=(path,), daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _write_records(self, path):
+        """Writer thread: drain the queue into a CSV or JSONL file until told to stop"""
+        names = self.phase_names()
+        as_json = path.endswith('.jsonl')
+        with open(path, 'w') as log:
+            if not as_json:
+                log.write(','.join(['frame_number'] + [f'{name}_ns' for name in names]) + '\n')
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                frame_number, record = item
+                if as_json:
+                    log.write(json.dumps({'frame_number': frame_number, **record}) + '\n')
+                else:
+                    log.write(','.join([str(frame_number)] + [str(record.get(name, 0)) for name in names]) + '\n')
+
+    def close(self):
+        """Flush and stop the log writer"""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
@@ -0,0 +1,118 @@
+from itertools import repeat
+import numpy as np
+
+class ProjectileArray:
+    """A class to manage enemy projectiles as NumPy arrays instead of sprites
+
+    Live projectiles are packed into the first `count` slots of each array, so
+    moving, culling and colliding are single vectorized operations. Selected
+    with settings.projectile_engine = 'numpy'.
+    """
+
+    def __init__(self, ak_game):
+        """Allocate the arrays and grab the shared projectile image"""
+        self.screen = ak_game.screen
+        self.settings = ak_game.settings
+        self.image = ak_game.assets.circle(self.settings.projectile_size, self.settings.projectile_color)
+        self.mask = ak_game.assets.mask(self.image)
+        self.size = self.settings.projectile_size * 2  # Projectiles are square, like their sprite rects
+
+        self.count = 0
+        self._allocate(self.settings.projectile_array_capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _allocate(self, capacity):
+        """(Re)allocate the arrays, keeping any live projectiles"""
+        old = getattr(self, 'x', None)
+        self.capacity = capacity
+        arrays = {}
+        for name in ('x', 'y', 'previous_y', 'vx', 'vy'):
+            arrays[name] = np.zeros(capacity, dtype=np.float64)
+        arrays['alive'] = np.zeros(capacity, dtype=bool)
+        if old is not None:
+            for name, array in arrays.items():
+                array[:self.count] = getattr(self, name)[:self.count]
+        for name, array in arrays.items():
+            setattr(self, name, array)
+
+    def spawn(self, x, y):
+        """Add a projectile centred on (x, y), moving down"""
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        i = self.count
+        # Same rounding as the sprite: integer rect centred on (x, y), float top
+        self.x[i] = int(x) - self.size // 2
+        self.y[i] = self.previous_y[i] = int(y) - self.size // 2
+        self.vx[i] = 0.0
+        self.vy[i] = self.settings.projectile_speed
+        self.alive[i] = True
+        self.count += 1
+
+    def clear(self):
+        """Remove every projectile"""
+        self.alive[:self.count] = False
+        self.count = 0
+
+    def store_previous_positions(self):
+        """Remember positions before a simulation step, for interpolation"""
+        self.previous_y[:self.count] = self.y[:self.count]
+
+    def update(self, dt):
+        """Move every projectile and cull those past the bottom margin"""
+        n = self.count
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        bottom = self.settings.screen_height - self.settings.margin - self.settings.outer_border_thickness - 2 * self.settings.inner_border_thickness
+        self.alive[:n] &= self.y[:n] < bottom
+        self._compact()
+
+    def collide(self, rect, mask=None):
+        """Remove projectiles overlapping rect and return how many there were
+
+        With a mask (of the sprite at rect), projectiles whose rects overlap are
+        then tested pixel by pixel against it.
+        """
+        n = self.count
+        left = np.floor(self.x[:n])
+        top = np.floor(self.y[:n])
+        hits = (
+            (left < rect.right) & (left + self.size > rect.left)
+            & (top < rect.bottom) & (top + self.size > rect.top)
+        )
+        if mask is not None:
+            for i in np.flatnonzero(hits):
+                if not mask.overlap(self.mask, (int(left[i]) - rect.x, int(top[i]) - rect.y)):
+                    hits[i] = False
+        hit_count = int(np.count_nonzero(hits))
+        if hit_count:
+            self.alive[:n] &= ~hits
+            self._compact()
+        return hit_count
+
+    def _compact(self):
+        """Pack live projectiles to the front of the arrays"""
+        n = self.count
+        live = np.flatnonzero(self.alive[:n])
+        if len(live) == n:
+            return
+        m = len(live)
+        for array in (self.x, self.y, self.previous_y, self.vx, self.vy):
+            array[:m] = array[live]
+        self.alive[:m] = True
+        self.alive[m:n] = False
+        self.count = m
+
+    def draw(self, alpha=1.0):
+        """Blit every projectile in one batch and return the rects drawn"""
+        n = self.count
+        if not n:
+            return []
+        y = self.y[:n]
+        if alpha < 1.0:
+            y = self.previous_y[:n] + (y - self.previous_y[:n]) * alpha
+        positions = zip(self.x[:n].astype(np.int32).tolist(), y.astype(np.int32).tolist())
+        # Rects are only worth building when the dirty-rect renderer will use them
+        drawn = self.screen.blits(zip(repeat(self.image), positions), doreturn=self.settings.dirty_rect_rendering)
+        return drawn or []
@@ -1,34 +1,52 @@
-import pygame
 from pygame.sprite import Sprite
 
 class Projectile(Sprite):
-    """A class to manage projectiles fired by thhe octos"""
+    """A class to manage projectiles fired by thhe octos
 
-    def __init__(self, ak_game, x, y): # Direction should be passed, e.g., 1 for down, -1 for up
+    Projectiles are recycled through the game's projectile_pool; kill() hands them back.
+    Sprite itself keeps a __dict__, so __slots__ only covers the fields below.
+    """
+
+    __slots__ = ('screen', 'settings', 'pool', 'grid', 'image', 'rect', 'mask', 'y', 'previous_topleft')
+
+    def __init__(self, ak_game, x=0, y=0): # Direction should be passed, e.g., 1 for down, -1 for up
         super().__init__()
         self.screen = ak_game.screen
         self.settings = ak_game.settings
+        self.pool = ak_game.projectile_pool
+        self.grid = ak_game.projectile_grid  # Column grid; we only fall straight down, so no updates needed
 
-        # Setup projectile appearance
-        self.image = pygame.Surface((self.settings.projectile_size * 2, self.settings.projectile_size * 2))
-        self.image.fill((0, 0, 0))  # Fill with transparent color if needed
-        self.image.set_colorkey((0, 0, 0))  # Set transparency
-        pygame.draw.circle(self.image, self.settings.projectile_color, (self.settings.projectile_size, self.settings.projectile_size), self.settings.projectile_size)
+        # Setup projectile appearance; the circle image is shared by every projectile
+        self.image = ak_game.assets.circle(self.settings.projectile_size, self.settings.projectile_color)
 
         self.rect = self.image.get_rect()
+        self.mask = ak_game.assets.mask(self.image)
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Place a new or recycled projectile centred on (x, y)"""
         self.rect.centerx = x
         self.rect.centery = y
+        self.previous_topleft = self.rect.topleft
 
         # Store projectile position as float
         self.y = float(self.rect.y)
 
-    def update(self):
-        self.y += self.settings.projectile_speed
+    def update(self, dt):
+        """Move the projectile down; dt is the step length in seconds"""
+        self.y += self.settings.projectile_speed * dt
         self.rect.y = int(self.y)
 
         if self.rect.top >= self.settings.screen_height - self.settings.margin - self.settings.outer_border_thickness - 2 * self.settings.inner_border_thickness:
             self.kill()
 
+    def kill(self):
+        """Remove the projectile from its groups and return it to the pool"""
+        if self.alive():
+            super().kill()
+            self.grid.remove(self)
+            self.pool.release(self)
+
     def draw_projectile(self):
-        """Draw the projectile on the screen"""
-        self.screen.blit(self.image, self.rect)
+        """Draw the projectile on the screen and return the area drawn"""
+        return self.screen.blit(self.image, self.rect)
@@ -0,0 +1,77 @@
+import pygame
+
+class DirtyRectRenderer:
+    """A class to push only the changed parts of the screen to the display"""
+
+    def __init__(self, ak_game):
+        """Initialize the renderer; the first frame is always a full redraw"""
+        self.game = ak_game
+        self.settings = ak_game.settings
+
+        self._last_rects = []
+        self.full_redraw = True
+
+        # Stats
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.last_dirty_area = 0
+
+    def invalidate(self):
+        """Force a full redraw on the next frame (e.g. after the game over screen)"""
+        self.full_redraw = True
+
+    def render(self):
+        """Erase last frame's sprites, draw this frame's and update the changed rects"""
+        screen = self.game.screen
+        background = self.game.background
+
+        if background.refresh() or self.full_redraw:
+            background.draw()
+            self._last_rects = self.game._draw_game_elements()
+            self.game._present()
+            self.full_redraw = False
+            self.full_frames += 1
+            self.last_dirty_area = screen.get_width() * screen.get_height()
+            return
+
+        # Everything drawn last frame is erased, so the screen is clean background again
+        background.restore(self._last_rects)
+        new_rects = self.game._draw_game_elements()
+        if len(self._last_rects) + len(new_rects) > self.settings.dirty_rect_max_rects:
+            # Merging thousands of rects costs more than the flip it would save
+            self._last_rects = new_rects
+            self.game._present()
+            self.full_frames += 1
+            self.last_dirty_area = screen.get_width() * screen.get_height()
+            return
+        dirty_rects = self._merge_rects(self._last_rects + new_rects)
+        self._last_rects = new_rects
+
+        screen_rect = screen.get_rect()
+        self.last_dirty_area = 0
+        for rect in dirty_rects:
+            clipped = rect.clip(screen_rect)
+            self.last_dirty_area += clipped.width * clipped.height
+        max_area = self.settings.dirty_rect_max_fraction * screen_rect.width * screen_rect.height
+        if self.last_dirty_area > max_area:
+            # Too much changed; one flip is cheaper than many small updates
+            self.game._present()
+            self.full_frames += 1
+        else:
+            self.game._present(dirty_rects)
+            self.partial_frames += 1
+
+    @staticmethod
+    def _merge_rects(rects):
+        """Union overlapping rects so a sprite's old and new positions become one region"""
+        merged = []
+        for rect in rects:
+            for i, other in enumerate(merged):
+                union = other.union(rect)
+                # Only merge when the union is no bigger than the two rects on their own
+                if union.width * union.height <= other.width * other.height + rect.width * rect.height:
+                    merged[i] = union
+                    break
+            else:
+                merged.append(pygame.Rect(rect))
+        return merged
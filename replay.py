@@ -0,0 +1,165 @@
+"""Record the inputs of a session and replay it bit-exactly
+
+A replay file holds the RNG seed, the gameplay settings (compressed JSON),
+every gameplay key event with the simulation tick it was handled on, and
+a checksum of the final game state. Playback re-runs the simulation as
+fast as the CPU allows and checks that it ends in the same state.
+
+Replay a file from the project root:
+    python replay.py session.akr                   # headless, no rendering
+    python replay.py session.akr --render-every 10 # draw every 10th step
+"""
+import argparse
+import atexit
+import json
+import struct
+import sys
+import zlib
+import pygame
+
+MAGIC = b'AKRP'
+VERSION = 1
+HEADER = struct.Struct('<4sHQI')    # magic, version, seed, length of the settings blob
+COUNT = struct.Struct('<I')         # number of events
+EVENT = struct.Struct('<IBi')       # tick, event type, key
+FOOTER = struct.Struct('<II')       # final tick, state checksum
+
+EVENT_TYPES = {pygame.KEYDOWN: 0, pygame.KEYUP: 1}
+RECORDED_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE, pygame.K_r, pygame.K_p)
+
+# Settings that only affect presentation or tooling, not the simulation
+PRESENTATION_SETTINGS = ('headless', 'sound_enabled', 'seed', 'replay_', 'profiler_', 'dirty_rect_', 'capture_',
+                         'render_fps', 'max_frame_time', 'scene_event_timeout', 'asset_cache_bytes',
+                         'asset_bundle_path', 'loader_threads', 'startup_report',
+                         'pacing_', 'quality_', 'render_skip', 'max_render_skip')
+
+
+def gameplay_settings(settings):
+    """Every plain setting that can change how the simulation plays out"""
+    return {
+        name: value for name, value in vars(settings).items()
+        if isinstance(value, (bool, int, float, str, tuple, type(None)))
+        and not name.startswith(PRESENTATION_SETTINGS)
+    }
+
+
+def state_checksum(ak_game):
+    """CRC of the full simulation state: positions, health, timers and RNG"""
+    state = [
+        ak_game.tick, ak_game.sim_time, ak_game.game_over, ak_game.game_over_reason,
+        ak_game.kitty.x, ak_game.kitty.health,
+        [(o.octo_type, o.rect.topleft, o.health, o.last_shot_time, o.shoot_delay) for o in ak_game.octo],
+        [b.rect.topleft for b in ak_game.bullets],
+        [p.rect.topleft for p in ak_game.projectiles],
+        ak_game.rng.getstate(),
+    ]
+    checksum = zlib.crc32(repr(state).encode())
+    if ak_game.projectile_array is not None:
+        n = ak_game.projectile_array.count
+        checksum = zlib.crc32(ak_game.projectile_array.x[:n].tobytes(), checksum)
+        checksum = zlib.crc32(ak_game.projectile_array.y[:n].tobytes(), checksum)
+    return checksum
+
+
+class ReplayRecorder:
+    """A class to record gameplay key events with the tick they were handled on"""
+
+    def __init__(self, ak_game, path):
+        """Start recording; the file is written when the game exits"""
+        self.game = ak_game
+        self.path = path
+        self.events = []
+        atexit.register(self.save)
+
+    def record(self, event):
+        """Keep a key event if it affects gameplay"""
+        event_type = EVENT_TYPES.get(event.type)
+        if event_type is not None and event.key in RECORDED_KEYS:
+            self.events.append((self.game.tick, event_type, event.key))
+
+    def save(self):
+        """Write the replay file"""
+        settings = zlib.compress(json.dumps(gameplay_settings(self.game.settings)).encode())
+        with open(self.path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.game.seed, len(settings)))
+            f.write(settings)
+            f.write(COUNT.pack(len(self.events)))
+            for event in self.events:
+                f.write(EVENT.pack(*event))
+            f.write(FOOTER.pack(self.game.tick, state_checksum(self.game)))
+
+
+class Replay:
+    """A loaded replay file"""
+
+    def __init__(self, path):
+        """Read and validate a replay file"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, self.seed, settings_size = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} Alien Kitty replay")
+        offset = HEADER.size
+        self.settings = json.loads(zlib.decompress(data[offset:offset + settings_size]))
+        offset += settings_size
+        (count,) = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        self.events = [EVENT.unpack_from(data, offset + i * EVENT.size) for i in range(count)]
+        offset += count * EVENT.size
+        self.final_tick, self.checksum = FOOTER.unpack_from(data, offset)
+
+    def play(self, render_every=0):
+        """Re-run the session as fast as possible; returns (game, state matched)
+
+        With render_every=N the game is drawn every Nth step, otherwise it runs headless.
+        """
+        from alien_kitty import AlienKitty
+
+        # JSON turns tuples into lists; colours and sizes must be tuples again
+        # Filtered again so older replays that recorded e.g. the capture path don't overwrite it
+        overrides = {name: tuple(value) if isinstance(value, list) else value for name, value in self.settings.items()
+                     if not name.startswith(PRESENTATION_SETTINGS)}
+        overrides.update(seed=self.seed, sound_enabled=False)
+        ak = AlienKitty(headless=not render_every, overrides=overrides)
+
+        pending = iter(self.events)
+        event = next(pending, None)
+        while True:
+            # Apply every event that was handled before this step
+            while event is not None and event[0] == ak.tick:
+                tick, event_type, key = event
+                pygame_type = pygame.KEYDOWN if event_type == 0 else pygame.KEYUP
+                ak._handle_event(pygame.event.Event(pygame_type, key=key))
+                event = next(pending, None)
+            if ak.tick >= self.final_tick:
+                break
+            if ak.game_over or ak.paused:
+                # The live game doesn't step here either; the next event has to be at this tick
+                raise ValueError(f"replay stalled at tick {ak.tick}: no event to leave the menu")
+            ak._store_previous_positions()
+            ak._update_game()
+            if render_every and ak.tick % render_every == 0:
+                ak._render_objects()
+                pygame.event.pump()
+        return ak, state_checksum(ak) == self.checksum
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fast-forward an Alien Kitty replay')
+    parser.add_argument('path')
+    parser.add_argument('--render-every', type=int, default=0, metavar='N', help='draw every Nth step (default: never)')
+    args = parser.parse_args()
+
+    replay = Replay(args.path)
+    ak, matched = replay.play(args.render_every)
+    print(f"Replayed {replay.final_tick} steps ({replay.final_tick / ak.settings.sim_hz:.0f} s of play), "
+          f"{len(replay.events)} events")
+    print(f"Final state: {ak.get_state()}")
+    if not matched:
+        print('MISMATCH: the replay did not reproduce the recorded session')
+        sys.exit(1)
+    print('Final state matches the recording')
+
+
+if __name__ == '__main__':
+    main()
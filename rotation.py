@@ -0,0 +1,36 @@
+import pygame
+
+class RotationCache:
+    """A class to hold an image pre-rotated to a fixed number of angles
+
+    Each angle has its image, an optional tinted (hit-flash) copy, the
+    bounding rect centred on (0, 0) and a collision mask, so rotating a
+    sprite at runtime is a table lookup. One cache is shared by every
+    sprite using the same image, size and step count.
+    """
+
+    def __init__(self, image, steps, flash_image=None):
+        """Rotate image (and the hit-flash frame, if given) to steps evenly spaced angles"""
+        self.steps = steps
+        self.images = []
+        self.flash_images = [] if flash_image else None
+        self.rects = []
+        self.masks = []
+        for i in range(steps):
+            angle = i * 360 / steps
+            # rotozoom antialiases, which is affordable since it only runs once per angle
+            rotated = pygame.transform.rotozoom(image, angle, 1.0).convert_alpha()
+            self.images.append(rotated)
+            self.rects.append(rotated.get_rect(center=(0, 0)))
+            self.masks.append(pygame.mask.from_surface(rotated))
+            if flash_image:
+                self.flash_images.append(pygame.transform.rotozoom(flash_image, angle, 1.0).convert_alpha())
+
+    def index(self, angle):
+        """Nearest step to angle, in degrees counterclockwise"""
+        return round(angle * self.steps / 360) % self.steps
+
+    def bytes(self):
+        """Approximate memory used by the rotated images"""
+        count = 2 if self.flash_images else 1
+        return count * sum(image.get_width() * image.get_height() * image.get_bytesize() for image in self.images)
@@ -0,0 +1,125 @@
+import pygame
+
+class StaticScene:
+    """Base class for scenes that don't change from frame to frame
+
+    The scene is rendered once into a cached surface and only pushed to the
+    display when it changes, so showing it costs nothing while idle.
+    """
+
+    def __init__(self, ak_game):
+        """Initialize the scene; nothing is rendered until the first draw"""
+        self.game = ak_game
+        self.settings = ak_game.settings
+        self.assets = ak_game.assets
+
+        self.surface = None
+        self._key = None
+        self._shown = False
+
+    def _scene_key(self):
+        """Everything the cached surface depends on; subclasses add their own state"""
+        return self.game.screen.get_size()
+
+    def _render(self, surface):
+        """Draw the scene onto surface"""
+        raise NotImplementedError
+
+    def invalidate(self):
+        """Re-render and re-show the scene on the next draw"""
+        self._key = None
+
+    def draw(self):
+        """Show the scene, re-rendering it only if something changed since last time"""
+        key = self._scene_key()
+        if key != self._key:
+            self.surface = pygame.Surface(self.game.screen.get_size()).convert()
+            self._render(self.surface)
+            self._key = key
+            self._shown = False
+        if not self._shown:
+            self.game.screen.blit(self.surface, (0, 0))
+            self.game._present()
+            self._shown = True
+
+    def _blit_text(self, surface, message, size, color, center):
+        """Blit cached text centred on center"""
+        text = self.assets.text(message, size, color)
+        surface.blit(text, text.get_rect(center=center))
+
+
+class GameOverScene(StaticScene):
+    """Game over screen when kitty or octo dies"""
+
+    def _scene_key(self):
+        return (super()._scene_key(), self.game.game_over_reason)
+
+    def _render(self, surface):
+        # Fill the screen with a dark overlay or another appropriate game over background
+        surface.fill((0, 0, 0))  # Using black for simplicity
+
+        # Set the main game over font size dynamically based on screen height
+        scale = self.settings.render_scale
+        game_over_font_size = max(round(40 * scale), int(self.settings.screen_height / 10))
+        instructions_font_size = max(round(20 * scale), int(self.settings.screen_height / 20))  # Smaller font size for instructions
+
+        if self.game.game_over_reason == 'octo':
+            message = 'OCTO HAS BEEN DEFEATED!'
+        else:
+            message = 'GAME OVER!'
+
+        center_x = self.settings.screen_width / 2
+        center_y = self.settings.screen_height / 2
+        self._blit_text(surface, message, game_over_font_size, (255, 0, 0), (center_x, center_y - game_over_font_size))  # Red color
+        self._blit_text(surface, 'Press "R" to Restart', instructions_font_size, (255, 255, 255), (center_x, center_y))
+        self._blit_text(surface, 'Press "Q" to Quit', instructions_font_size, (255, 255, 255), (center_x, center_y + instructions_font_size))
+
+
+class PausedScene(StaticScene):
+    """Dimmed snapshot of the game with a pause message on top"""
+
+    def enter(self):
+        """Capture the current frame to show behind the pause message"""
+        self.snapshot = self.game.screen.copy()
+        self.invalidate()
+
+    def _render(self, surface):
+        surface.blit(self.snapshot, (0, 0))
+        shade = pygame.Surface(surface.get_size())
+        shade.set_alpha(160)
+        surface.blit(shade, (0, 0))
+
+        scale = self.settings.render_scale
+        paused_font_size = max(round(40 * scale), int(self.settings.screen_height / 10))
+        instructions_font_size = max(round(20 * scale), int(self.settings.screen_height / 20))
+        center_x = self.settings.screen_width / 2
+        center_y = self.settings.screen_height / 2
+        self._blit_text(surface, 'PAUSED', paused_font_size, (255, 255, 255), (center_x, center_y - paused_font_size))
+        self._blit_text(surface, 'Press "P" to Resume', instructions_font_size, (255, 255, 255), (center_x, center_y))
+
+
+class LoadingScene(StaticScene):
+    """Progress bar shown while the startup assets load"""
+
+    def __init__(self, ak_game):
+        super().__init__(ak_game)
+        self.progress = 0.0
+
+    def _scene_key(self):
+        # Re-render in whole percent steps, not on every progress call
+        return (super()._scene_key(), int(self.progress * 100))
+
+    def _render(self, surface):
+        surface.fill(self.settings.gradient_start_color)
+        width, height = surface.get_size()
+        center_x, center_y = width / 2, height / 2
+
+        font_size = max(round(30 * self.settings.render_scale), int(self.settings.screen_height / 16))
+        self._blit_text(surface, 'Loading...', font_size, (255, 255, 255), (center_x, center_y - font_size))
+
+        bar = pygame.Rect(0, 0, width // 2, 20)
+        bar.center = (center_x, center_y + 10)
+        pygame.draw.rect(surface, (255, 255, 255), bar, 2)
+        fill = bar.inflate(-8, -8)
+        fill.width = int(fill.width * self.progress)
+        pygame.draw.rect(surface, self.settings.outer_border_color, fill)
@@ -1,5 +1,3 @@
-import pygame
-
 class Settings():
     """A class to store all the settings for Alien Kitty"""
 
@@ -7,10 +5,38 @@ class Settings():
         """Initialize the game's settings"""
         self.game_over = False
 
-        # Screen settings
+        # Simulation settings
+        self.headless = False           # Set by AlienKitty(headless=True); no window, rendering or sound
+        self.sound_enabled = True
+
+        # Replay settings
+        self.seed = None                # Gameplay RNG seed; None picks a fresh one each run
+        self.replay_record_path = None  # Write the session's inputs to this replay file
+
+        # Timing settings; all speeds below are in pixels (or degrees) per second
+        self.sim_hz = 60                # Fixed simulation steps per second
+        self.render_fps = 60            # Render rate cap; gameplay is identical at 30, 60 or 144
+        self.max_frame_time = 0.25      # Longest real-time gap the simulation will catch up on
+        self.scene_event_timeout = 500  # Milliseconds a static scene (game over, paused) sleeps waiting for input
+
+        # Frame pacing settings (interactive loop only)
+        self.pacing_mode = 'sleep'          # 'sleep' (clock.tick), 'busy' (tick_busy_loop: tighter, burns a core) or 'vsync'
+        self.render_skip = True             # Drop the render of a frame that starts over a frame late; simulation never skips
+        self.max_render_skip = 3            # ...but never more than this many in a row
+        self.pacing_smoothing = 0.1         # Weight of the newest frame in the smoothed update and render costs
+        self.quality_tiers = True           # Shed stars, minion health bars, then hit flashes while frames run long
+        self.quality_degrade_load = 1.1     # Drop a tier while update + render cost stays above this share of the frame...
+        self.quality_restore_load = 0.6     # ...and restore one while it stays below this share
+        self.quality_sustain_frames = 60    # Frames the load must stay out of range before the tier changes
+        self.pacing_latency_window = 120    # Input-to-present latencies kept for the percentiles
+
+        # Screen settings; the window always has this logical size
         self.screen_width = 900
         self.screen_height = 800
         self.bg_color = (230, 230, 230)
+        self.render_scale = 1.0                     # Internal resolution as a share of the window; 0.5 draws a quarter of the pixels
+        self.render_scale_mode = 'scaled'           # 'scaled' lets SDL stretch to the window (pygame.SCALED, whole factors only; others blit), 'blit' scales in software
+        self.pixel_scale = 1.0                      # Scale the pixel settings are currently at; see apply_render_scale()
 
         # Margin settings
         self.margin = 20  # Margin for all game elements
@@ -27,11 +53,17 @@ class Settings():
         self.gradient_start_color = (25, 25, 112)   # Midnight Blue
         self.gradient_end_color = (0, 0, 0)         # Black
 
+        # Starfield settings
+        self.star_count = 20                        # Adjust number for more/less stars
+        self.star_color = (255, 255, 255)           # Small white dots
+        self.star_seed = 42                         # Fixed seed keeps the starfield stable
+
         # Kitty settings
-        self.kitty_speed = 2.5
+        self.kitty_speed = 150.0
+        self.kitty_size = (125, 125)
 
         # Bullet settings
-        self.bullet_speed = 4.0
+        self.bullet_speed = 240.0
         self.bullet_width = 5
         self.bullet_height = 20
         self.bullet_color = (255, 248, 231)         # Cosmic latte
@@ -40,6 +72,18 @@ class Settings():
         # Octo settings
         self.boss_alien_size = (400, 400)
         self.small_alien_size = (100, 100)
+        self.boss_speed = 60.0                      # Horizontal drift of the boss
+        self.minion_orbit_speed = 30.0              # Degrees per second around the boss
+        self.boss_count = 1                         # Bosses spread across the screen
+        self.minion_formation = (('ring', 5),)      # Shapes around each boss: ('ring', count[, radius, phase]),
+                                                    # ('rings', counts[, inner, outer]), ('spiral', count[, turns, inner, outer]);
+                                                    # radii are fractions of the distance to the nearest screen edge
+        self.formation_engine = 'python'            # 'python', or 'numpy' to move big swarms in one vectorized pass
+        self.minion_rotation_steps = 64             # Pre-rotated angles minions face their travel with; 0 = don't rotate
+        self.octo_shoot_delay = (5.0, 10.0)         # Seconds between shots, picked at random
+        self.hit_flash_duration = 10                # Simulation steps an octo flashes after a hit
+        self.hit_flash_color = (255, 0, 0, 128)     # Multiplied into the octo image (tint red)
+        self.blast_frame_time = 0.2                 # Seconds per frame of the explosion animations
 
         # Health settings (Octo)
         self.max_boss_health = 30
@@ -48,16 +92,101 @@ class Settings():
         self.max_minion_health = 5
         self.minion_health_bar_length = 50
         self.minion_health_bar_height = 5
+        self.minion_health_bar_limit = 300          # Skip minion health bars when more minions than this; None = always draw
 
         # Health settings (Kitty)
         self.max_kitty_health = 3
+        self.kitty_health_bar_length = 150
+        self.kitty_health_bar_height = 20
         
         # Projectile settings
-        self.projectile_speed = 1.5
+        self.projectile_speed = 90.0
         self.projectile_color = (255, 0, 0)    
         self.projectile_size = 10
+        self.projectile_engine = 'sprite'           # 'sprite', or 'numpy' for thousands of projectiles
+        self.projectile_array_capacity = 1024       # Initial slots for the numpy engine; grows as needed
+
+        # Render settings
+        self.dirty_rect_rendering = False           # Update only changed regions instead of flipping
+        self.dirty_rect_max_fraction = 0.5          # Fall back to a full flip above this share of the screen
+        self.dirty_rect_max_rects = 500             # ...or when more rects than this were drawn
+
+        # Collision settings
+        self.collision_broadphase = True            # Use a spatial hash instead of testing every pair
+        self.collision_mode = 'mask'                # 'mask' for pixel-perfect hits after a rect test, or 'rect'
+        self.spatial_hash_cell_size = 100           # Grid cell size in pixels
+
+        # Object pool settings
+        self.bullet_pool_capacity = 64              # Most idle bullets kept for reuse
+        self.projectile_pool_capacity = 256         # Most idle projectiles kept for reuse
+        self.projectile_pool_prefill = 32           # Projectiles created up front
+
+        # Profiler settings (F3 toggles the on-screen overlay)
+        self.profiler_enabled = False               # Time every frame phase from startup
+        self.profiler_window = 300                  # Frames kept for the rolling percentiles
+        self.profiler_hud_refresh = 30              # Frames between overlay re-renders
+        self.profiler_hud_font_size = 20
+        self.profiler_log_path = None               # e.g. 'profile.csv' or 'profile.jsonl'
+        self.profiler_queue_size = 1024             # Records buffered for the writer thread before dropping
+
+        # Frame capture settings (capture.py)
+        self.capture_downsample = 1                 # Keep every Nth pixel in each direction
+        self.capture_grayscale = False
+        self.capture_ring_size = 4                  # Recent frames kept by FrameCapture.grab()
+        self.capture_writer_slots = 8               # Frames the recording thread may fall behind by
+        self.capture_record_path = None             # Record gameplay: '.raw' is written as-is, anything else via ffmpeg
+
+        # Training environment settings (env.py)
+        self.env_frame_skip = 4                     # Simulation steps per agent action
+        self.env_max_episode_steps = 5000           # Agent actions before an episode is truncated
+        self.env_frame_size = (84, 84)              # Width, height of 'frame' observations
+        self.env_observed_minions = 5               # Minion slots in 'state' observations
+        self.env_observed_projectiles = 8           # Nearest projectiles in 'state' observations
+        self.env_reward_octo_hit = 1.0              # Reward per point of octo health taken
+        self.env_reward_kitty_hit = -10.0           # Reward per point of kitty health lost
+
+        # Asset cache settings
+        self.asset_cache_bytes = 16 * 1024 * 1024   # LRU budget for cached surfaces
+        self.asset_bundle_path = 'assets.bundle'    # Built by bundle.py; PNGs are used when missing or stale
+
+        # Startup settings
+        self.loader_threads = 4                     # Threads decoding images and sounds behind the loading screen
+        self.startup_report = False                 # Print how long each startup phase took
+
+        # Music settings; sounds are decoded while the loading screen shows, music starts in the background
+        self.bullet_sound_path = 'sounds/bullet.wav'
+        self.blast_sound_path = 'sounds/blast.wav'
+        self.kitty_sound_path = 'sounds/Meow.wav'
+        self.music_path = 'sounds/Space.mp3'
+
+    # Settings measured in pixels (or pixels per second), in the logical 900x800 frame
+    PIXEL_SETTINGS = (
+        'screen_width', 'screen_height', 'margin', 'outer_border_thickness', 'inner_border_thickness',
+        'kitty_speed', 'kitty_size', 'bullet_speed', 'bullet_width', 'bullet_height',
+        'boss_alien_size', 'small_alien_size', 'boss_speed',
+        'boss_health_bar_length', 'boss_health_bar_height', 'minion_health_bar_length', 'minion_health_bar_height',
+        'kitty_health_bar_length', 'kitty_health_bar_height',
+        'projectile_speed', 'projectile_size', 'spatial_hash_cell_size', 'profiler_hud_font_size',
+    )
+
+    def apply_render_scale(self):
+        """Convert the pixel settings to the internal resolution given by render_scale
+
+        Called once the overrides are in. pixel_scale records the scale they
+        are at, so settings that were already converted (as a replay stores
+        them) are left alone.
+        """
+        factor = self.render_scale / self.pixel_scale
+        if factor == 1:
+            return
+        for name in self.PIXEL_SETTINGS:
+            setattr(self, name, self._scale_pixels(getattr(self, name), factor))
+        self.pixel_scale = self.render_scale
 
-        # Music settings
-        self.bullet_sound = pygame.mixer.Sound('sounds/bullet.wav')
-        self.blast_sound = pygame.mixer.Sound('sounds/blast.wav')
-        self.kitty_sound = pygame.mixer.Sound('sounds/Meow.wav')
\ No newline at end of file
+    @staticmethod
+    def _scale_pixels(value, factor):
+        if isinstance(value, tuple):
+            return tuple(Settings._scale_pixels(v, factor) for v in value)
+        if isinstance(value, float):
+            return value * factor
+        return max(1, round(value * factor))  # Whole pixels, and nothing shrinks away entirely
@@ -0,0 +1,194 @@
+"""Capture the whole game state as plain data and put it back
+
+A snapshot is a dict of numbers, strings and lists: the clock, the RNG
+state, the kitty, every octo (health, flash, shot timers and its slot in
+its boss's formation) and the live bullets and projectiles. restore()
+reuses the octo, bullet and projectile objects the game already has, so
+it loads and scales no images. The game snapshots the level once it is
+built and restores that to restart.
+
+Checkpoint to disk and back:
+    snapshot.save(ak.snapshot(), 'checkpoint.aks')
+    ak.restore(snapshot.load('checkpoint.aks'))
+"""
+import json
+import zlib
+import pygame
+from octo import Octo
+
+VERSION = 1
+
+
+def capture(ak_game):
+    """The current game state as a snapshot dict"""
+    game = ak_game
+    octos = list(game.octo)
+    if not game.boss_octo.alive():
+        octos.append(game.boss_octo)  # Still referenced, e.g. by the training environment
+    index = {octo: i for i, octo in enumerate(octos)}
+
+    octo_records = []
+    for octo in octos:
+        record = {
+            'type': octo.octo_type, 'image': octo.image_path, 'alive': octo.alive(),
+            'rect': list(octo.rect), 'rotated': octo.image not in (octo.original_image, octo.flash_image), 'x': octo.x, 'velocity': octo.velocity, 'health': octo.health,
+            'heading': octo.heading, 'last_shot_time': octo.last_shot_time, 'shoot_delay': octo.shoot_delay,
+            'flash': [octo.flash.active, octo.flash.counter],
+        }
+        formation = octo.formation
+        if formation is not None and formation.boss in index:
+            i = octo.formation_index
+            record['formation'] = [index[formation.boss], float(formation.angles[i]), float(formation.radii[i])]
+        octo_records.append(record)
+
+    version, state, gauss_next = game.rng.getstate()
+    return {
+        'version': VERSION,
+        'tick': game.tick,
+        'frames': game.frames,
+        'sim_time': game.sim_time,
+        'game_over': game.game_over,
+        'game_over_reason': game.game_over_reason,
+        'rng': [version, list(state), gauss_next],
+        'kitty': {'x': game.kitty.x, 'health': game.kitty.health},
+        'octos': octo_records,
+        'boss_octo': index[game.boss_octo],
+        'bullets': [[bullet.rect.x, bullet.rect.y, bullet.y] for bullet in game.bullets],
+        'projectiles': _capture_projectiles(game),
+    }
+
+
+def _capture_projectiles(game):
+    """[x, y, float y] per sprite, or the packed arrays of the NumPy engine"""
+    array = game.projectile_array
+    if array is None:
+        return [[p.rect.x, p.rect.y, p.y] for p in game.projectiles]
+    n = array.count
+    return {name: getattr(array, name)[:n].tolist() for name in ('x', 'y', 'previous_y', 'vx', 'vy')}
+
+
+def restore(ak_game, snapshot, restart=False):
+    """Put the game into the state of snapshot
+
+    With restart, the level is reset instead: the RNG, the step counter and
+    the kitty's position are left alone and every octo draws new shot
+    timers, as building the level from scratch would.
+    """
+    if snapshot.get('version') != VERSION:
+        raise ValueError(f"not a version {VERSION} game snapshot")
+    game = ak_game
+
+    game.game_over = snapshot['game_over']
+    game.game_over_reason = snapshot['game_over_reason']
+    game.frames = snapshot['frames']
+    game.sim_time = snapshot['sim_time']
+    if not restart:
+        game.tick = snapshot['tick']
+        version, state, gauss_next = snapshot['rng']
+        game.rng.setstate((version, tuple(state), gauss_next))
+        game.kitty.x = snapshot['kitty']['x']
+        game.kitty.rect.x = game.kitty.x
+    game.kitty.health = snapshot['kitty']['health']
+
+    octos = _restore_octos(game, snapshot['octos'])
+    game.boss_octo = octos[snapshot['boss_octo']]
+    if restart:
+        for octo in octos:
+            octo.roll_shot_timer()  # Same draws, in the same order, as creating the octos
+
+    # Kill rather than empty so bullets and projectiles go back to their pools
+    for sprite in [*game.bullets, *game.projectiles]:
+        sprite.kill()
+    for x, y, float_y in snapshot['bullets']:
+        bullet = game.bullet_pool.acquire()
+        bullet.rect.topleft = (x, y)
+        bullet.previous_topleft = bullet.rect.topleft
+        bullet.y = float_y
+        game.bullets.add(bullet)
+    _restore_projectiles(game, snapshot['projectiles'])
+
+    game.animations.empty()  # Explosions are only for show; a game ending in one ends straight away
+    if not game.bosses and not game.game_over:
+        game._on_boss_blast_complete()
+
+
+def _restore_octos(game, records):
+    """Rebuild the octo groups and formations from records, reusing octo objects; returns them in order"""
+    spare = {}
+    for octo in [*game.octo, *game.fallen_octos]:
+        spare.setdefault(octo.image_path, []).append(octo)
+    game.fallen_octos.clear()
+    game.octo.empty()
+    game.bosses.empty()
+    game.minions.empty()
+    game.formations.clear()
+
+    octos = []
+    for record in records:
+        reusable = spare.get(record['image'])
+        if reusable:
+            octo = reusable.pop()
+        else:
+            state = game.rng.getstate()
+            octo = Octo(game, record['image'], 0, 0, octo_type=record['type'])
+            game.rng.setstate(state)  # Its shot timer draws would shift the restored random stream
+        octo.formation = octo.formation_index = None
+        octo.x = record['x']
+        octo.velocity = record['velocity']
+        octo.health = record['health']
+        octo.heading = record['heading']
+        octo.last_shot_time = record['last_shot_time']
+        octo.shoot_delay = record['shoot_delay']
+        octo.flash.active, octo.flash.counter = record['flash']
+        octo.rect = pygame.Rect(record['rect'])
+        octo.image = octo.original_image
+        octo.mask = game.assets.mask(octo.original_image)
+        if record['rotated']:
+            octo._face_heading(False)  # The pre-rotated frame and mask that fit this rect
+        octo.previous_topleft = octo.rect.topleft
+        if record['alive']:
+            game.octo.add(octo)
+            (game.bosses if octo.octo_type == 'boss' else game.minions).add(octo)
+        octos.append(octo)
+
+    for octo, record in zip(octos, records):
+        if 'formation' in record:
+            boss, angle, radius = record['formation']
+            game._formation(octos[boss]).adopt(octo, angle, radius)
+    return octos
+
+
+def _restore_projectiles(game, projectiles):
+    """Refill the projectile group from the pool, or the NumPy engine's arrays"""
+    array = game.projectile_array
+    if array is None:
+        for x, y, float_y in projectiles:
+            projectile = game.projectile_pool.acquire()
+            projectile.rect.topleft = (x, y)
+            projectile.previous_topleft = projectile.rect.topleft
+            projectile.y = float_y
+            game.projectiles.add(projectile)
+            if game.settings.collision_broadphase:
+                game.projectile_grid.insert(projectile)
+        return
+
+    array.clear()
+    n = len(projectiles['x'])
+    while array.capacity < n:
+        array._allocate(array.capacity * 2)
+    for name, values in projectiles.items():
+        getattr(array, name)[:n] = values
+    array.alive[:n] = True
+    array.count = n
+
+
+def save(snapshot, path):
+    """Write snapshot to path as compressed JSON"""
+    with open(path, 'wb') as f:
+        f.write(zlib.compress(json.dumps(snapshot, separators=(',', ':')).encode()))
+
+
+def load(path):
+    """Read a snapshot written by save()"""
+    with open(path, 'rb') as f:
+        return json.loads(zlib.decompress(f.read()))
@@ -0,0 +1,140 @@
+import pygame
+
+class SpatialHash:
+    """A uniform grid that buckets sprites by the cells their rects cover
+
+    It can be rebuilt from scratch every check (rebuild) or kept up to date
+    as sprites move (insert / update / remove), whichever is cheaper. With
+    columns_only=True cells are full-height columns, so sprites that only move
+    vertically never need updating at all.
+    """
+
+    def __init__(self, cell_size, columns_only=False):
+        """Initialize an empty grid with square cells of cell_size pixels"""
+        self.cell_size = cell_size
+        self.columns_only = columns_only
+        self._cells = {}
+        self._spans = {}  # sprite -> (first col, last col, first row, last row)
+        self._order = {}  # Insertion order, so results match group iteration order
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._spans)
+
+    def clear(self):
+        """Remove every sprite from the grid"""
+        self._cells.clear()
+        self._spans.clear()
+        self._order.clear()
+        self._counter = 0
+
+    def rebuild(self, sprites):
+        """Clear the grid and insert all the given sprites"""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def insert(self, sprite):
+        """Add a sprite to every cell its rect touches"""
+        self._order[sprite] = self._counter
+        self._counter += 1
+        span = self._span(sprite.rect)
+        self._spans[sprite] = span
+        self._add_to_cells(sprite, span)
+
+    def update(self, sprite):
+        """Move a sprite to new cells, if its rect has crossed a cell boundary"""
+        span = self._span(sprite.rect)
+        old_span = self._spans[sprite]
+        if span != old_span:
+            self._remove_from_cells(sprite, old_span)
+            self._spans[sprite] = span
+            self._add_to_cells(sprite, span)
+
+    def remove(self, sprite):
+        """Take a sprite out of the grid; unknown sprites are ignored"""
+        span = self._spans.pop(sprite, None)
+        if span is not None:
+            del self._order[sprite]
+            self._remove_from_cells(sprite, span)
+
+    def collide(self, rect):
+        """Return the sprites whose rects overlap rect, in insertion order"""
+        found = set()
+        for cell in self._cells_in(self._span(rect)):
+            bucket = self._cells.get(cell)
+            if bucket:
+                found.update(bucket)
+        hits = [sprite for sprite in found if rect.colliderect(sprite.rect)]
+        if len(hits) > 1:
+            hits.sort(key=self._order.__getitem__)
+        return hits
+
+    def _span(self, rect):
+        """Range of cells a rect covers; right/bottom are exclusive, hence the - 1"""
+        size = self.cell_size
+        if self.columns_only:
+            return (rect.left // size, (rect.right - 1) // size, 0, 0)
+        return (rect.left // size, (rect.right - 1) // size, rect.top // size, (rect.bottom - 1) // size)
+
+    @staticmethod
+    def _cells_in(span):
+        """Yield the (column, row) keys inside a span"""
+        first_col, last_col, first_row, last_row = span
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                yield (col, row)
+
+    def _add_to_cells(self, sprite, span):
+        for cell in self._cells_in(span):
+            bucket = self._cells.get(cell)
+            if bucket is None:
+                self._cells[cell] = {sprite}
+            else:
+                bucket.add(sprite)
+
+    def _remove_from_cells(self, sprite, span):
+        for cell in self._cells_in(span):
+            bucket = self._cells[cell]
+            bucket.discard(sprite)
+            if not bucket:
+                del self._cells[cell]
+
+
+def collide_mask(left, right):
+    """pygame.sprite.collide_mask behind a cheap rect test; both need a cached .mask"""
+    return left.rect.colliderect(right.rect) and pygame.sprite.collide_mask(left, right) is not None
+
+
+def hashed_groupcollide(grid, groupa, groupb, dokilla, collided=None):
+    """Same result as pygame.sprite.groupcollide(groupa, groupb, dokilla, False, collided)
+
+    groupb is rebuilt into grid first; use this when groupb is small and moves a lot.
+    collided only runs on pairs whose rects overlap.
+    """
+    grid.rebuild(groupb)
+    collisions = {}
+    for sprite in groupa.sprites():
+        hits = grid.collide(sprite.rect)
+        if hits and collided is not None:
+            hits = [hit for hit in hits if collided(sprite, hit)]
+        if hits:
+            collisions[sprite] = hits
+            if dokilla:
+                sprite.kill()
+    return collisions
+
+
+def hashed_spritecollide(grid, sprite, dokill, collided=None):
+    """Same result as pygame.sprite.spritecollide(sprite, group, dokill, collided)
+
+    grid must already hold exactly the sprites of group, kept up to date as they move.
+    collided only runs on sprites whose rects overlap.
+    """
+    hits = grid.collide(sprite.rect)
+    if collided is not None:
+        hits = [hit for hit in hits if collided(sprite, hit)]
+    if dokill:
+        for hit in hits:
+            hit.kill()
+    return hits